@@ -0,0 +1,197 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class AlertActuator:
+    """
+    Fires driver alerts from decision transitions without blocking the frame loop.
+
+    `on_decision()` is called from the frame loop once per decision. It only
+    compares states and, when an alert is due, hands it to a worker thread
+    through a bounded queue; it never waits. The worker calls every output
+    and records the decision-to-alert latency, from on_decision() until all
+    outputs have fired.
+
+    An alert fires when the state becomes DROWSY. While the driver stays
+    DROWSY it repeats every `repeat_interval_sec`, escalating one level per
+    repeat up to `max_level`. The level is reset once the driver has been
+    out of DROWSY for `reset_after_sec`.
+    """
+
+    def __init__(
+        self,
+        outputs,
+        repeat_interval_sec=3.0,
+        max_level=2,
+        reset_after_sec=10.0,
+        queue_size=8,
+        latency_history=1000,
+    ):
+        """
+        Args:
+            outputs (list): objects with fire(level, decision)
+            repeat_interval_sec (float): delay between repeated alerts while
+                the driver stays DROWSY
+            max_level (int): highest escalation level
+            reset_after_sec (float): time out of DROWSY that resets escalation
+            queue_size (int): pending alerts; further alerts are dropped
+            latency_history (int): number of latency samples kept
+        """
+        self.outputs = outputs
+        self.repeat_interval_sec = repeat_interval_sec
+        self.max_level = max_level
+        self.reset_after_sec = reset_after_sec
+
+        self.state = None
+        self.level = 0
+        self.alerts_requested = 0
+        self.alerts_dropped = 0
+        self.alerts_fired = 0
+        self.output_errors = 0
+        self.latencies_ms = deque(maxlen=latency_history)
+
+        self._last_alert_ts = None
+        self._last_drowsy_ts = None
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="dms-alert", daemon=True)
+        self._thread.start()
+
+    def on_decision(self, decision, timestamp_ms):
+        """
+        Feeds one decision; returns immediately.
+
+        Args:
+            decision (dict): decision engine output with a "state" key
+            timestamp_ms (int): timestamp of the frame the decision is for
+
+        Returns:
+            bool: True if an alert was queued
+        """
+        state = decision["state"]
+        previous = self.state
+        self.state = state
+
+        if state != "DROWSY":
+            return False
+
+        if (
+            self._last_drowsy_ts is not None
+            and (timestamp_ms - self._last_drowsy_ts) / 1000.0 >= self.reset_after_sec
+        ):
+            self.level = 0
+        self._last_drowsy_ts = timestamp_ms
+
+        if previous == "DROWSY":
+            if (timestamp_ms - self._last_alert_ts) / 1000.0 < self.repeat_interval_sec:
+                return False
+            self.level = min(self.level + 1, self.max_level)
+
+        self._last_alert_ts = timestamp_ms
+        self.alerts_requested += 1
+        try:
+            self._queue.put_nowait((time.perf_counter(), self.level, decision))
+        except queue.Full:
+            self.alerts_dropped += 1
+            return False
+        return True
+
+    def latency_stats(self):
+        """
+        Returns:
+            dict: {"count", "p50_ms", "p95_ms", "max_ms"} of decision-to-alert
+            latency, or None values if no alert has fired yet
+        """
+        with self._lock:
+            latencies = np.array(self.latencies_ms)
+        if latencies.size == 0:
+            return {"count": 0, "p50_ms": None, "p95_ms": None, "max_ms": None}
+        return {
+            "count": int(latencies.size),
+            "p50_ms": float(np.percentile(latencies, 50)),
+            "p95_ms": float(np.percentile(latencies, 95)),
+            "max_ms": float(latencies.max()),
+        }
+
+    def close(self, timeout_sec=2.0):
+        """Stops the worker after pending alerts have been fired."""
+        self._queue.put(_STOP)
+        self._thread.join(timeout=timeout_sec)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            requested_at, level, decision = item
+            for output in self.outputs:
+                try:
+                    output.fire(level, decision)
+                except Exception:
+                    self.output_errors += 1
+                    logger.exception("Alert output %r failed", output)
+
+            # Includes time spent in the outputs, not only in the queue
+            latency_ms = (time.perf_counter() - requested_at) * 1000.0
+            with self._lock:
+                self.latencies_ms.append(latency_ms)
+            self.alerts_fired += 1
+
+
+class LogAlertOutput:
+    """Writes alerts to a logger."""
+
+    def __init__(self, log=None):
+        self.log = log or logger
+
+    def fire(self, level, decision):
+        self.log.warning(
+            "DROWSY alert level %d (eyes closed %.2fs)",
+            level,
+            decision.get("closed_time_sec", 0.0),
+        )
+
+
+class SoundDeviceAlertOutput:
+    """
+    Plays alert tones through sounddevice.
+
+    One tone per escalation level is synthesized up front, so firing an alert
+    only hands a ready buffer to the audio device.
+    """
+
+    def __init__(
+        self,
+        frequencies_hz=(880.0, 1320.0, 1760.0),
+        duration_sec=0.4,
+        volume=0.5,
+        sample_rate=44100,
+    ):
+        try:
+            import sounddevice
+        except (ImportError, OSError) as exc:
+            raise RuntimeError(
+                "sounddevice (and the PortAudio library) is required for audio alerts"
+            ) from exc
+
+        self.sounddevice = sounddevice
+        self.sample_rate = sample_rate
+        t = np.arange(int(duration_sec * sample_rate)) / sample_rate
+        self.buffers = [
+            (volume * np.sin(2.0 * np.pi * frequency * t)).astype(np.float32)
+            for frequency in frequencies_hz
+        ]
+
+    def fire(self, level, decision):
+        buffer = self.buffers[min(level, len(self.buffers) - 1)]
+        self.sounddevice.play(buffer, self.sample_rate)
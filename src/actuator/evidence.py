@@ -0,0 +1,268 @@
+import logging
+import os
+import queue
+import threading
+from collections import deque
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class EvidenceRecorder:
+    """
+    Keeps the last `pre_event_sec` of frames and writes a clip around events.
+
+    push() is called from the frame loop with every frame and only hands the
+    image reference to a worker thread through a bounded queue; it never
+    copies or waits. The worker optionally downscales and JPEG-compresses
+    the frame into a ring of `pre_event_sec * fps` slots. Without JPEG the
+    ring is a single array allocated on the first frame.
+
+    trigger() (e.g. on a transition to DROWSY) starts a clip made of the
+    ring contents plus the frames of the next `post_event_sec`. Triggers
+    bypass the frame queue, so frames may be dropped but triggers never
+    are. Finished clips are written to `output_dir` by a second thread, so
+    encoding never delays the ring or the frame loop. A trigger within the
+    window of a clip still collecting frames is merged into it.
+
+    Memory is bounded by the ring, the frame queue, one clip being
+    collected and `clip_queue_size` clips waiting to be written. When a
+    queue is full the frame or clip is dropped and counted. A frame that
+    cannot be stored, or a clip that cannot be written, is logged, counted
+    and skipped.
+
+    Images must not be modified after push().
+    """
+
+    def __init__(
+        self,
+        output_dir,
+        pre_event_sec=5.0,
+        post_event_sec=5.0,
+        fps=30.0,
+        scale=1.0,
+        jpeg_quality=80,
+        queue_size=None,
+        clip_queue_size=2,
+        fourcc="mp4v",
+        extension=".mp4",
+    ):
+        """
+        Args:
+            output_dir (str): directory clips are written to
+            pre_event_sec (float): seconds of frames kept before a trigger
+            post_event_sec (float): seconds of frames recorded after it
+            fps (float): expected frame rate; sizes the ring and is the
+                frame rate of written clips
+            scale (float): downscale factor applied to stored frames
+            jpeg_quality (int | None): JPEG quality of stored frames, 0-100;
+                None stores raw frames
+            queue_size (int | None): frames waiting for the worker, defaults
+                to one second of frames
+            clip_queue_size (int): finished clips waiting to be written
+            fourcc (str): codec of written clips
+            extension (str): file extension of written clips
+        """
+        self.output_dir = output_dir
+        self.pre_event_ms = pre_event_sec * 1000.0
+        self.post_event_ms = post_event_sec * 1000.0
+        self.fps = fps
+        self.scale = scale
+        self.jpeg_quality = jpeg_quality
+        self.fourcc = fourcc
+        self.extension = extension
+        self.capacity = max(1, int(round(pre_event_sec * fps)))
+
+        self.frames_dropped = 0
+        self.triggers_merged = 0
+        self.clips_dropped = 0
+        self.clips_written = 0
+        self.store_errors = 0
+        self.encode_errors = 0
+        self.clip_paths = []
+
+        self._slots = [None] * self.capacity
+        self._slot_ts = [0] * self.capacity
+        self._raw = None
+        self._next = 0
+        self._count = 0
+        self._clip = None
+
+        os.makedirs(output_dir, exist_ok=True)
+        self._frames = queue.Queue(maxsize=queue_size or max(1, int(fps)))
+        self._clips = queue.Queue(maxsize=clip_queue_size)
+        # deque.append/popleft are thread-safe; triggers are rare
+        self._triggers = deque()
+        self._ring_thread = threading.Thread(
+            target=self._run_ring, name="dms-evidence-ring", daemon=True
+        )
+        self._encoder_thread = threading.Thread(
+            target=self._run_encoder, name="dms-evidence-encoder", daemon=True
+        )
+        self._ring_thread.start()
+        self._encoder_thread.start()
+
+    def push(self, image, timestamp_ms):
+        """
+        Feeds one frame; returns immediately.
+
+        Returns:
+            bool: False if the frame was dropped because the worker is behind
+        """
+        try:
+            self._frames.put_nowait((timestamp_ms, image))
+        except queue.Full:
+            self.frames_dropped += 1
+            return False
+        return True
+
+    def trigger(self, timestamp_ms, label="event"):
+        """Requests a clip around `timestamp_ms`; returns immediately."""
+        self._triggers.append((timestamp_ms, label))
+
+    def close(self, timeout_sec=10.0):
+        """Writes the clip being collected, if any, and stops both threads."""
+        try:
+            self._frames.put(_STOP, timeout=timeout_sec)
+        except queue.Full:
+            logger.error("Evidence ring is not draining frames; clip may be lost")
+            return
+        self._ring_thread.join(timeout=timeout_sec)
+        self._encoder_thread.join(timeout=timeout_sec)
+
+    def _run_ring(self):
+        while True:
+            item = self._frames.get()
+            # Frames still queued from before a trigger are appended to its
+            # clip in order, so the clip stays complete and chronological
+            while self._triggers:
+                self._start_clip(*self._triggers.popleft())
+
+            if item is _STOP:
+                self._finish_clip()
+                self._clips.put(_STOP)
+                return
+
+            try:
+                self._add_frame(*item)
+            except Exception:
+                self.store_errors += 1
+                logger.exception("Could not store evidence frame")
+
+    def _add_frame(self, timestamp_ms, image):
+        if self._clip is not None and timestamp_ms > self._clip["end_ms"]:
+            self._finish_clip()
+
+        entry = self._store(timestamp_ms, image)
+        if self._clip is not None and timestamp_ms > self._clip["start_ms"]:
+            self._clip["frames"].append(self._detach(entry))
+
+    def _store(self, timestamp_ms, image):
+        if self.scale != 1.0:
+            image = cv2.resize(
+                image,
+                None,
+                fx=self.scale,
+                fy=self.scale,
+                interpolation=cv2.INTER_AREA,
+            )
+
+        index = self._next
+        if self.jpeg_quality is not None:
+            ok, buffer = cv2.imencode(
+                ".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+            )
+            if not ok:
+                raise ValueError("Could not encode frame as JPEG")
+            self._slots[index] = buffer
+        else:
+            if self._raw is None or self._raw.shape[1:] != image.shape:
+                # First frame, or the camera came back at another resolution
+                self._raw = np.empty((self.capacity,) + image.shape, dtype=image.dtype)
+                self._count = 0
+            self._raw[index] = image
+            self._slots[index] = self._raw[index]
+
+        self._slot_ts[index] = timestamp_ms
+        self._next = (index + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        return self._slots[index]
+
+    def _detach(self, entry):
+        # Raw slots are overwritten as the ring wraps; JPEG buffers are not
+        return entry.copy() if self.jpeg_quality is None else entry
+
+    def _start_clip(self, timestamp_ms, label):
+        if self._clip is not None:
+            if timestamp_ms <= self._clip["end_ms"]:
+                self.triggers_merged += 1
+                return
+            self._finish_clip()
+
+        start_ms = timestamp_ms - self.pre_event_ms
+        frames = []
+        for offset in range(self._count):
+            index = (self._next - self._count + offset) % self.capacity
+            if self._slot_ts[index] > start_ms:
+                frames.append(self._detach(self._slots[index]))
+
+        self._clip = {
+            "label": label,
+            "timestamp_ms": timestamp_ms,
+            "start_ms": start_ms,
+            "end_ms": timestamp_ms + self.post_event_ms,
+            "frames": frames,
+        }
+
+    def _finish_clip(self):
+        clip, self._clip = self._clip, None
+        if clip is None or not clip["frames"]:
+            return
+        try:
+            self._clips.put_nowait(clip)
+        except queue.Full:
+            self.clips_dropped += 1
+
+    def _run_encoder(self):
+        while True:
+            clip = self._clips.get()
+            if clip is _STOP:
+                return
+            try:
+                self._write_clip(clip)
+            except Exception:
+                self.encode_errors += 1
+                logger.exception("Could not write evidence clip")
+
+    def _write_clip(self, clip):
+        path = os.path.join(
+            self.output_dir,
+            f"{clip['label']}_{int(clip['timestamp_ms'])}{self.extension}",
+        )
+        writer = None
+        try:
+            for entry in clip["frames"]:
+                image = entry
+                if self.jpeg_quality is not None:
+                    image = cv2.imdecode(entry, cv2.IMREAD_COLOR)
+                if writer is None:
+                    height, width = image.shape[:2]
+                    writer = cv2.VideoWriter(
+                        path,
+                        cv2.VideoWriter_fourcc(*self.fourcc),
+                        self.fps,
+                        (width, height),
+                    )
+                    if not writer.isOpened():
+                        raise RuntimeError(f"Could not open video writer for {path}")
+                writer.write(image)
+        finally:
+            if writer is not None:
+                writer.release()
+
+        self.clip_paths.append(path)
+        self.clips_written += 1
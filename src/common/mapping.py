@@ -0,0 +1,31 @@
+from collections.abc import Mapping
+
+
+class SlotMapping(Mapping):
+    """
+    Read-only Mapping over some of the attributes of a slotted class.
+
+    The pipeline contracts (Frame, LandmarkResult, Decision) were dicts.
+    They are now slotted classes read by attribute, and this base keeps
+    them usable as those dicts. Subclasses list the dict keys in `_KEYS`,
+    or override `_keys()` when the keys depend on the instance. Attributes
+    outside the keys are not part of the Mapping.
+    """
+
+    __slots__ = ()
+
+    _KEYS = ()
+
+    def _keys(self):
+        return self._KEYS
+
+    def __getitem__(self, key):
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
@@ -0,0 +1,46 @@
+from ..common.mapping import SlotMapping
+
+
+class Decision(SlotMapping):
+    """
+    Decision engine output for one frame.
+
+    Attribute access (decision.state) is the fast path. The class is also a
+    read-only Mapping over the keys of the original dicts: "state" and
+    "closed_time_sec", plus "face_absent_sec" for face-absent frames. So
+    decision["state"], decision.get(...) and equality with those dicts keep
+    working. Instances may be shared between frames and must not be
+    modified.
+
+    Attributes:
+        state (str): "AWAKE", "DROWSY", "NO_FACE" or "CAMERA_STALLED"
+        closed_time_sec (float): how long the eyes have been closed
+        face_absent_sec (float | None): how long the face has been missing,
+            None on frames with a face
+    """
+
+    __slots__ = ("state", "closed_time_sec", "face_absent_sec")
+
+    _KEYS = ("state", "closed_time_sec")
+    _FACE_ABSENT_KEYS = _KEYS + ("face_absent_sec",)
+
+    def __init__(self, state, closed_time_sec=0.0, face_absent_sec=None):
+        self.state = state
+        self.closed_time_sec = closed_time_sec
+        self.face_absent_sec = face_absent_sec
+
+    def _keys(self):
+        return self._KEYS if self.face_absent_sec is None else self._FACE_ABSENT_KEYS
+
+    def __repr__(self):
+        return (
+            f"Decision(state={self.state!r}, closed_time_sec={self.closed_time_sec!r}, "
+            f"face_absent_sec={self.face_absent_sec!r})"
+        )
+
+
+# Returned for every frame with open eyes, the common case
+AWAKE_OPEN = Decision("AWAKE")
+
+# Returned while the camera delivers no frames
+CAMERA_STALLED = Decision("CAMERA_STALLED")
@@ -0,0 +1,150 @@
+class _Debounced:
+    """Tracks a value that must hold for `hold_ms` before it is reported."""
+
+    def __init__(self, hold_ms):
+        self.hold_ms = hold_ms
+        self.value = None
+        self.candidate = None
+        self.candidate_since = None
+
+    def feed(self, value, timestamp_ms):
+        """Returns (previous, new, since_ms) when the value changes, else None."""
+        if value == self.value:
+            self.candidate = None
+            return None
+
+        if value != self.candidate:
+            self.candidate = value
+            self.candidate_since = timestamp_ms
+
+        if timestamp_ms - self.candidate_since < self.hold_ms:
+            return None
+
+        previous = self.value
+        self.value = value
+        self.candidate = None
+        return previous, value, self.candidate_since
+
+
+class DecisionEventEmitter:
+    """
+    Turns the per-frame decision stream into sparse events.
+
+    Instead of one record per frame, `feed()` returns events only when
+    something changes:
+    - "transition": the decision state changed (e.g. AWAKE -> DROWSY)
+    - "face_lost" / "face_regained": face detection changed
+    - "heartbeat": every `heartbeat_interval_sec`, with statistics
+      aggregated since the previous heartbeat
+
+    A new state or face status must persist for `hysteresis_sec` before it is
+    reported, which suppresses flicker around thresholds. Events carry the
+    timestamp at which the change started, not when it was confirmed.
+    """
+
+    def __init__(self, hysteresis_sec=0.0, heartbeat_interval_sec=60.0):
+        """
+        Args:
+            hysteresis_sec (float): minimum duration of a change before it
+                is emitted
+            heartbeat_interval_sec (float | None): period of heartbeat
+                events; None disables heartbeats
+        """
+        self.hysteresis_sec = hysteresis_sec
+        self.heartbeat_interval_sec = heartbeat_interval_sec
+
+        hold_ms = hysteresis_sec * 1000.0
+        self._state = _Debounced(hold_ms)
+        self._face = _Debounced(hold_ms)
+
+        self._last_ts = None
+        self._heartbeat_start_ts = None
+        self._reset_stats()
+
+    def feed(self, decision, timestamp_ms, face_detected=True):
+        """
+        Args:
+            decision (dict): decision engine output
+            timestamp_ms (int): timestamp of the frame
+            face_detected (bool): whether the frame had a face
+
+        Returns:
+            list[dict]: events, usually empty
+        """
+        events = []
+
+        change = self._state.feed(decision["state"], timestamp_ms)
+        if change is not None:
+            previous, state, since_ms = change
+            events.append(
+                {
+                    "type": "transition",
+                    "from": previous,
+                    "to": state,
+                    "timestamp_ms": since_ms,
+                    "confirmed_ms": timestamp_ms,
+                }
+            )
+
+        change = self._face.feed(face_detected, timestamp_ms)
+        # The first face status only sets the baseline
+        if change is not None and change[0] is not None:
+            events.append(
+                {
+                    "type": "face_regained" if change[1] else "face_lost",
+                    "timestamp_ms": change[2],
+                    "confirmed_ms": timestamp_ms,
+                }
+            )
+
+        self._accumulate(decision, timestamp_ms, face_detected)
+
+        if self._heartbeat_start_ts is None:
+            self._heartbeat_start_ts = timestamp_ms
+        elif (
+            self.heartbeat_interval_sec is not None
+            and (timestamp_ms - self._heartbeat_start_ts) / 1000.0
+            >= self.heartbeat_interval_sec
+        ):
+            events.append(self._heartbeat(decision, timestamp_ms))
+
+        return events
+
+    def _accumulate(self, decision, timestamp_ms, face_detected):
+        dt_sec = 0.0
+        if self._last_ts is not None:
+            dt_sec = max(timestamp_ms - self._last_ts, 0) / 1000.0
+        self._last_ts = timestamp_ms
+
+        closed_time_sec = decision.get("closed_time_sec", 0.0)
+        self._frames += 1
+        if closed_time_sec > 0.0:
+            self._closed_time_sec += dt_sec
+        self._max_closed_time_sec = max(self._max_closed_time_sec, closed_time_sec)
+        if decision["state"] == "DROWSY":
+            self._drowsy_time_sec += dt_sec
+        if not face_detected:
+            self._face_absent_time_sec += dt_sec
+
+    def _heartbeat(self, decision, timestamp_ms):
+        event = {
+            "type": "heartbeat",
+            "timestamp_ms": timestamp_ms,
+            "state": decision["state"],
+            "interval_sec": (timestamp_ms - self._heartbeat_start_ts) / 1000.0,
+            "frames": self._frames,
+            "closed_time_sec": self._closed_time_sec,
+            "max_closed_time_sec": self._max_closed_time_sec,
+            "drowsy_time_sec": self._drowsy_time_sec,
+            "face_absent_time_sec": self._face_absent_time_sec,
+        }
+        self._heartbeat_start_ts = timestamp_ms
+        self._reset_stats()
+        return event
+
+    def _reset_stats(self):
+        self._frames = 0
+        self._closed_time_sec = 0.0
+        self._max_closed_time_sec = 0.0
+        self._drowsy_time_sec = 0.0
+        self._face_absent_time_sec = 0.0
@@ -0,0 +1,125 @@
+import numpy as np
+
+STATE_AWAKE = 0
+STATE_DROWSY = 1
+STATE_NAMES = np.array(["AWAKE", "DROWSY"])
+
+# Marks drivers whose eyes are currently open (closed_start_ts is None)
+NO_CLOSED_START = np.iinfo(np.int64).min
+
+
+class MultiDriverDecisionEngine:
+    """
+    Time-consecutive decision engine for many drivers at once.
+
+    Applies the same rules as TimeConsecutiveDecisionEngine, but keeps the
+    per-driver state in NumPy arrays indexed by driver id and updates every
+    driver present in a batch with a single vectorized step. Work per batch
+    depends only on the batch size, not on the number of drivers.
+    """
+
+    def __init__(self, num_drivers, ear_threshold, min_closed_time_sec):
+        self.num_drivers = num_drivers
+        self.ear_threshold = ear_threshold
+        self.min_closed_time_sec = min_closed_time_sec
+
+        self.closed_start_ts = np.full(num_drivers, NO_CLOSED_START, dtype=np.int64)
+        self.state = np.full(num_drivers, STATE_AWAKE, dtype=np.uint8)
+
+    def update_batch(self, driver_ids, ears, timestamps_ms):
+        """
+        Update decision state from a batch of samples.
+
+        Samples are applied in batch order, so a driver may appear several
+        times in one batch with the same result as calling
+        TimeConsecutiveDecisionEngine.update() once per sample.
+
+        Args:
+            driver_ids (array-like[int]): driver index per sample, in [0, num_drivers)
+            ears (array-like[float]): Eye Aspect Ratio per sample
+            timestamps_ms (array-like[int]): timestamp in milliseconds per sample
+
+        Returns:
+            dict: {
+                "state": np.ndarray[uint8] (index into STATE_NAMES),
+                "closed_time_sec": np.ndarray[float64]
+            }
+            with one entry per sample, in batch order.
+        """
+        driver_ids = np.asarray(driver_ids, dtype=np.int64)
+        ears = np.asarray(ears, dtype=np.float64)
+        timestamps_ms = np.asarray(timestamps_ms, dtype=np.int64)
+
+        if not (driver_ids.shape == ears.shape == timestamps_ms.shape):
+            raise ValueError(
+                "driver_ids, ears and timestamps_ms must have the same shape"
+            )
+        if driver_ids.size and (
+            driver_ids.min() < 0 or driver_ids.max() >= self.num_drivers
+        ):
+            raise ValueError("driver id out of range")
+
+        states = np.empty(driver_ids.shape, dtype=np.uint8)
+        closed_time_sec = np.empty(driver_ids.shape, dtype=np.float64)
+
+        for idx in _rounds(driver_ids):
+            ids = driver_ids[idx]
+            ts = timestamps_ms[idx]
+            closed = ears[idx] < self.ear_threshold
+
+            # Open eyes (and first closed samples) measure from their own timestamp
+            start = self.closed_start_ts[ids]
+            start = np.where(closed & (start != NO_CLOSED_START), start, ts)
+
+            closed_sec = (ts - start) / 1000.0
+            state = np.where(
+                closed & (closed_sec >= self.min_closed_time_sec),
+                STATE_DROWSY,
+                STATE_AWAKE,
+            )
+
+            self.closed_start_ts[ids] = np.where(closed, start, NO_CLOSED_START)
+            self.state[ids] = state
+            states[idx] = state
+            closed_time_sec[idx] = closed_sec
+
+        return {
+            "state": states,
+            "closed_time_sec": closed_time_sec,
+        }
+
+    def get_state(self, driver_id):
+        """Returns the current state of one driver, e.g. "AWAKE"."""
+        return str(STATE_NAMES[self.state[driver_id]])
+
+    def reset(self, driver_ids=None):
+        """Forgets the history of the given drivers (all drivers by default)."""
+        if driver_ids is None:
+            driver_ids = slice(None)
+        self.closed_start_ts[driver_ids] = NO_CLOSED_START
+        self.state[driver_ids] = STATE_AWAKE
+
+
+def _rounds(driver_ids):
+    """
+    Splits a batch into rounds in which every driver appears at most once.
+
+    Round k holds the k-th sample of each driver, in batch order, so applying
+    the rounds one after another preserves per-driver ordering. Batches with
+    unique driver ids, the common case, form a single round.
+    """
+    n = driver_ids.size
+    if n == 0:
+        return []
+
+    order = np.argsort(driver_ids, kind="stable")
+    sorted_ids = driver_ids[order]
+    group_start = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    group_len = np.diff(np.r_[group_start, n])
+
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n) - np.repeat(group_start, group_len)
+
+    if rank.max() == 0:
+        return [np.arange(n)]
+    return [np.flatnonzero(rank == k) for k in range(rank.max() + 1)]
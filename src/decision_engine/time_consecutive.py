@@ -1,9 +1,16 @@
+from .decision import AWAKE_OPEN, CAMERA_STALLED, Decision
+
+
 class TimeConsecutiveDecisionEngine:
-    def __init__(self, ear_threshold, min_closed_time_sec):
+    def __init__(self, ear_threshold, min_closed_time_sec, face_absent_timeout_sec=1.0):
         self.ear_threshold = ear_threshold
         self.min_closed_time_sec = min_closed_time_sec
+        self.face_absent_timeout_sec = face_absent_timeout_sec
 
         self.closed_start_ts = None
+        self.face_absent_start_ts = None
+        self.face_absent_last_ts = None
+        self.closed_time_sec = 0.0
         self.state = "AWAKE"
 
     def update(self, ear, timestamp_ms):
@@ -15,11 +22,17 @@ class TimeConsecutiveDecisionEngine:
             timestamp_ms (int): timestamp in milliseconds
 
         Returns:
-            dict: {
-                "state": str,
-                "closed_time_sec": float
-            }
+            Decision: state and closed_time_sec
         """
+        if self.face_absent_start_ts is not None:
+            if self.closed_start_ts is not None:
+                # Frames without a face do not count as closed-eye time
+                self.closed_start_ts += (
+                    self.face_absent_last_ts - self.face_absent_start_ts
+                )
+            self.face_absent_start_ts = None
+            self.face_absent_last_ts = None
+
         if ear < self.ear_threshold:
             if self.closed_start_ts is None:
                 self.closed_start_ts = timestamp_ms
@@ -32,10 +45,61 @@ class TimeConsecutiveDecisionEngine:
                 self.state = "AWAKE"
         else:
             self.closed_start_ts = None
-            closed_time_sec = 0.0
+            self.closed_time_sec = 0.0
             self.state = "AWAKE"
+            return AWAKE_OPEN
+
+        self.closed_time_sec = closed_time_sec
+        return Decision(self.state, closed_time_sec)
+
+    def update_face_absent(self, timestamp_ms):
+        """
+        Update decision state for a frame in which no face was detected.
+
+        Frames without a face do not contribute to temporal accumulation
+        (ADR-003, section 7): closed-eye time is frozen during the loss, and
+        when the face returns the closed-eye timer is shifted forward by the
+        time it was absent. Brief losses keep the previous state. Once the
+        face has been absent for face_absent_timeout_sec, closed-eye
+        accumulation is reset and the state becomes NO_FACE until a face is
+        seen again.
+
+        Args:
+            timestamp_ms (int): timestamp in milliseconds
+
+        Returns:
+            Decision: state, closed_time_sec and face_absent_sec
+        """
+        if self.face_absent_start_ts is None:
+            self.face_absent_start_ts = timestamp_ms
+        self.face_absent_last_ts = timestamp_ms
 
-        return {
-            "state": self.state,
-            "closed_time_sec": closed_time_sec,
-        }
+        face_absent_sec = (timestamp_ms - self.face_absent_start_ts) / 1000.0
+
+        if face_absent_sec >= self.face_absent_timeout_sec:
+            self.closed_start_ts = None
+            self.closed_time_sec = 0.0
+            self.state = "NO_FACE"
+
+        return Decision(self.state, self.closed_time_sec, face_absent_sec)
+
+    def update_camera_stalled(self, timestamp_ms):
+        """
+        Update decision state while the camera delivers no frames.
+
+        Nothing is known about the driver, so closed-eye and face-absent
+        accumulation are reset and the state becomes CAMERA_STALLED until
+        frames resume.
+
+        Args:
+            timestamp_ms (int): timestamp in milliseconds
+
+        Returns:
+            Decision: state and closed_time_sec
+        """
+        self.closed_start_ts = None
+        self.face_absent_start_ts = None
+        self.face_absent_last_ts = None
+        self.closed_time_sec = 0.0
+        self.state = "CAMERA_STALLED"
+        return CAMERA_STALLED
@@ -0,0 +1 @@
+# Diagnostics package
@@ -0,0 +1,239 @@
+import os
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _SampledStage:
+    def __init__(self, tracker, name):
+        self.tracker = tracker
+        self.name = name
+
+    def __enter__(self):
+        self.bytes_before, _ = tracemalloc.get_traced_memory()
+        self.blocks_before = sys.getallocatedblocks()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        bytes_after, _ = tracemalloc.get_traced_memory()
+        self.tracker._record_stage(
+            self.name,
+            bytes_after - self.bytes_before,
+            sys.getallocatedblocks() - self.blocks_before,
+        )
+        return False
+
+
+class AllocationTracker:
+    """
+    Opt-in per-stage allocation and RSS tracking for long pipeline runs.
+
+    Every `sample_every` frames, each stage wrapped in `stage()` records the
+    traced bytes and allocated blocks (objects) it left behind. Other frames
+    only pay for a no-op context manager. Traced memory and RSS are sampled
+    once per sampled frame so growth over a long run can be measured with
+    `growth_per_frame()`, and `top_allocations()` compares tracemalloc
+    snapshots to locate where the memory went.
+
+    When `enabled` is False the tracker does nothing and costs almost nothing,
+    so it can stay wired into the main loop.
+    """
+
+    def __init__(self, enabled=True, sample_every=100, warmup_frames=0):
+        self.enabled = enabled
+        self.sample_every = sample_every
+        self.warmup_frames = warmup_frames
+
+        self.frame_count = 0
+        self.stages = {}
+        self.history = []
+        self.rss_start_bytes = None
+        self.baseline_snapshot = None
+        self._own_bytes = 0
+        self._started_tracing = False
+
+    def start(self):
+        if not self.enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self.rss_start_bytes = current_rss_bytes()
+        self.baseline_snapshot = _take_snapshot()
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def stage(self, name):
+        """
+        Context manager wrapping one pipeline stage for the current frame.
+
+        Args:
+            name (str): stage name, e.g. "read" or "extract"
+        """
+        if not self._is_sampled_frame():
+            return _NULL_STAGE
+        return _SampledStage(self, name)
+
+    def end_frame(self):
+        """Marks the end of a frame; call once per loop iteration."""
+        if not self.enabled:
+            return
+        if self._is_sampled_frame():
+            traced_bytes, _ = tracemalloc.get_traced_memory()
+            self.history.append(
+                {
+                    "frame": self.frame_count,
+                    "time": time.monotonic(),
+                    # Exclude the tracker's own history from the pipeline's growth
+                    "traced_bytes": traced_bytes - self._own_bytes,
+                    "rss_bytes": current_rss_bytes(),
+                }
+            )
+            self._own_bytes += tracemalloc.get_traced_memory()[0] - traced_bytes
+        self.frame_count += 1
+
+    def top_allocations(self, limit=10):
+        """
+        Returns the source lines that gained the most memory since start().
+
+        Takes a full tracemalloc snapshot, so call it rarely (e.g. at exit).
+
+        Returns:
+            list[{"location": str, "size_diff": int, "count_diff": int}]
+        """
+        if self.baseline_snapshot is None or not tracemalloc.is_tracing():
+            return []
+
+        diff = _take_snapshot().compare_to(self.baseline_snapshot, "lineno")
+        return [
+            {
+                "location": str(stat.traceback),
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in diff[:limit]
+        ]
+
+    def growth_per_frame(self, key="traced_bytes"):
+        """
+        Returns the least-squares memory growth in bytes per frame.
+
+        Args:
+            key (str): "traced_bytes" or "rss_bytes"
+
+        Returns:
+            float: slope over the sampled history, 0.0 with fewer than 2 samples
+        """
+        points = [
+            (sample["frame"], sample[key])
+            for sample in self.history
+            if sample[key] is not None
+        ]
+        if len(points) < 2:
+            return 0.0
+
+        n = len(points)
+        mean_x = sum(x for x, _ in points) / n
+        mean_y = sum(y for _, y in points) / n
+        var_x = sum((x - mean_x) ** 2 for x, _ in points)
+        if var_x == 0:
+            return 0.0
+        cov = sum((x - mean_x) * (y - mean_y) for x, y in points)
+        return cov / var_x
+
+    def report(self):
+        """
+        Returns:
+            dict: {
+                "frames": int,
+                "stages": {name: {"samples", "bytes_per_frame", "objects_per_frame"}},
+                "rss_start_bytes": int | None,
+                "rss_bytes": int | None,
+                "rss_drift_bytes": int | None,
+                "traced_growth_per_frame": float
+            }
+        """
+        stages = {}
+        for name, totals in self.stages.items():
+            samples = totals["samples"]
+            stages[name] = {
+                "samples": samples,
+                "bytes_per_frame": totals["bytes"] / samples,
+                "objects_per_frame": totals["objects"] / samples,
+            }
+
+        rss_bytes = current_rss_bytes() if self.enabled else None
+        rss_drift = None
+        if rss_bytes is not None and self.rss_start_bytes is not None:
+            rss_drift = rss_bytes - self.rss_start_bytes
+
+        return {
+            "frames": self.frame_count,
+            "stages": stages,
+            "rss_start_bytes": self.rss_start_bytes,
+            "rss_bytes": rss_bytes,
+            "rss_drift_bytes": rss_drift,
+            "traced_growth_per_frame": self.growth_per_frame(),
+        }
+
+    def _is_sampled_frame(self):
+        return (
+            self.enabled
+            and tracemalloc.is_tracing()
+            and self.frame_count >= self.warmup_frames
+            and self.frame_count % self.sample_every == 0
+        )
+
+    def _record_stage(self, name, size_bytes, count):
+        totals = self.stages.setdefault(name, {"samples": 0, "bytes": 0, "objects": 0})
+        totals["samples"] += 1
+        totals["bytes"] += size_bytes
+        totals["objects"] += count
+
+
+def _take_snapshot():
+    return tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+
+
+def current_rss_bytes():
+    """
+    Returns the resident set size of this process in bytes.
+
+    Reads /proc on Linux. Elsewhere falls back to the peak RSS reported by
+    getrusage, which can only grow. Returns None if neither is available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return max_rss if os.uname().sysname == "Darwin" else max_rss * 1024
@@ -0,0 +1,257 @@
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+logger = logging.getLogger(__name__)
+
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    def __init__(self, tracer, name, frame_id):
+        self.tracer = tracer
+        self.name = name
+        self.frame_id = frame_id
+
+    def __enter__(self):
+        self.start_us = self.tracer.now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.add_span(self.name, self.frame_id, self.start_us)
+        return False
+
+
+class FrameTracer:
+    """
+    Opt-in per-frame span recorder with Chrome/Perfetto trace export.
+
+    Each pipeline stage records a span tagged with its frame_id into a
+    bounded ring buffer, so tracing can stay on for hours. `dump()` writes the
+    buffer as Chrome trace JSON (open in chrome://tracing or ui.perfetto.dev).
+    `end_frame()` adds a glass-to-decision span from the frame's capture
+    timestamp and dumps automatically when it exceeds `spike_threshold_ms`.
+    Spans are buffered as plain tuples. A spike dump only copies the buffer,
+    which is bounded by `capacity`, on the calling thread; building the
+    trace, serializing and writing happen on a background thread, so a spike
+    never stalls the frame loop.
+    """
+
+    def __init__(
+        self,
+        enabled=True,
+        capacity=100000,
+        spike_threshold_ms=None,
+        spike_path=None,
+        spike_cooldown_sec=10.0,
+        clock=time.time,
+    ):
+        """
+        Args:
+            enabled (bool): when False every call is a cheap no-op
+            capacity (int): maximum number of spans kept in memory
+            spike_threshold_ms (float | None): glass-to-decision latency that
+                triggers an automatic dump; None disables spike dumps
+            spike_path (str | None): file written on a latency spike
+            spike_cooldown_sec (float): minimum time between spike dumps
+            clock (callable): wall clock used for capture timestamps, the
+                same one given to the frame source
+        """
+        self.enabled = enabled
+        self.spike_threshold_ms = spike_threshold_ms
+        self.spike_path = spike_path
+        self.spike_cooldown_sec = spike_cooldown_sec
+        self.clock = clock
+
+        # (name, start_us, dur_us, tid, frame_id) per span
+        self._spans = deque(maxlen=capacity)
+        self.spike_count = 0
+        self.spike_dumps_dropped = 0
+        self._last_spike_dump = None
+        # One pending spike dump at most; later spikes are dropped and counted
+        self._dumps = queue.Queue(maxsize=1)
+        self._writer = None
+        self._thread_names = {}
+        self._lock = threading.Lock()
+
+    @property
+    def events(self):
+        """list[dict]: buffered spans as Chrome trace events"""
+        with self._lock:
+            spans = tuple(self._spans)
+        return _trace_events(spans, os.getpid())
+
+    @staticmethod
+    def now_us():
+        return time.perf_counter() * 1e6
+
+    def span(self, name, frame_id):
+        """
+        Context manager recording one stage of one frame.
+
+        Args:
+            name (str): stage name, e.g. "extract"
+            frame_id (int): frame the stage works on
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, frame_id)
+
+    def add_span(self, name, frame_id, start_us, end_us=None):
+        """
+        Records a span measured by the caller, e.g. when frame_id is only
+        known once the stage has finished.
+
+        Args:
+            name (str): stage name
+            frame_id (int): frame the stage worked on
+            start_us (float): start time from now_us()
+            end_us (float | None): end time from now_us(), defaults to now
+        """
+        if not self.enabled:
+            return
+        if end_us is None:
+            end_us = self.now_us()
+
+        thread = threading.current_thread()
+        span = (name, start_us, end_us - start_us, thread.ident, frame_id)
+        with self._lock:
+            self._thread_names.setdefault(thread.ident, thread.name)
+            self._spans.append(span)
+
+    def end_frame(self, frame_id, capture_timestamp_ms, capture_monotonic_ns=None):
+        """
+        Records the glass-to-decision span of a frame and dumps the buffer
+        to `spike_path` if its latency exceeds `spike_threshold_ms`.
+
+        The latency is measured on the monotonic clock when the frame has a
+        monotonic capture time. Otherwise it is measured against `clock`,
+        sampled on every call so that clock adjustments only affect the
+        frames they happen during.
+
+        Args:
+            frame_id (int): frame that was just decided
+            capture_timestamp_ms (int): the frame's capture timestamp
+            capture_monotonic_ns (int | None): the frame's
+                time.monotonic_ns() at capture, if known
+
+        Returns:
+            float | None: glass-to-decision latency in milliseconds
+        """
+        if not self.enabled:
+            return None
+
+        end_us = self.now_us()
+        if capture_monotonic_ns is not None:
+            latency_ms = (time.monotonic_ns() - capture_monotonic_ns) / 1e6
+        else:
+            latency_ms = self.clock() * 1000.0 - capture_timestamp_ms
+        self.add_span(
+            "glass_to_decision", frame_id, end_us - latency_ms * 1000.0, end_us
+        )
+
+        if self.spike_threshold_ms is not None and latency_ms > self.spike_threshold_ms:
+            self.spike_count += 1
+            now = time.monotonic()
+            if self.spike_path is not None and (
+                self._last_spike_dump is None
+                or now - self._last_spike_dump >= self.spike_cooldown_sec
+            ):
+                self._last_spike_dump = now
+                self._dump_in_background(self.spike_path)
+
+        return latency_ms
+
+    def to_chrome_trace(self):
+        """
+        Returns:
+            dict: Chrome trace event format, ready for json.dump()
+        """
+        return _chrome_trace(*self._snapshot())
+
+    def dump(self, path):
+        """Writes the buffered spans to `path` as Chrome trace JSON."""
+        _write_json(path, self.to_chrome_trace())
+
+    def flush(self):
+        """Waits until pending spike dumps have been written."""
+        if self._writer is not None:
+            self._dumps.join()
+
+    def _snapshot(self):
+        with self._lock:
+            return tuple(self._spans), dict(self._thread_names)
+
+    def _dump_in_background(self, path):
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._run_writer, name="dms-trace-writer", daemon=True
+            )
+            self._writer.start()
+        try:
+            self._dumps.put_nowait((path, self._snapshot()))
+        except queue.Full:
+            self.spike_dumps_dropped += 1
+
+    def _run_writer(self):
+        while True:
+            path, snapshot = self._dumps.get()
+            try:
+                _write_json(path, _chrome_trace(*snapshot))
+            except OSError:
+                logger.exception("Could not write spike trace to %s", path)
+            finally:
+                self._dumps.task_done()
+
+
+def _trace_events(spans, pid):
+    return [
+        {
+            "name": name,
+            "cat": "pipeline",
+            "ph": "X",
+            "ts": start_us,
+            "dur": dur_us,
+            "pid": pid,
+            "tid": tid,
+            "args": {"frame_id": frame_id},
+        }
+        for name, start_us, dur_us, tid, frame_id in spans
+    ]
+
+
+def _chrome_trace(spans, thread_names):
+    pid = os.getpid()
+    metadata = [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": tid,
+            "args": {"name": name},
+        }
+        for tid, name in thread_names.items()
+    ]
+    return {
+        "traceEvents": metadata + _trace_events(spans, pid),
+        "displayTimeUnit": "ms",
+    }
+
+
+def _write_json(path, data):
+    # Written to a temporary file first so readers never see a partial trace
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
@@ -0,0 +1,78 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncFrameSource:
+    """
+    Async iterator over a blocking frame source.
+
+    Each `read()` runs on a single dedicated capture thread (VideoCapture is
+    not thread-safe), so the event loop stays free while OpenCV waits for the
+    camera. Failed reads are retried after `retry_delay_sec` instead of
+    spinning.
+
+    Usage:
+        async with AsyncFrameSource(WebcamFrameSource()) as frames:
+            async for frame in frames:
+                ...
+    """
+
+    def __init__(self, source, executor=None, retry_delay_sec=0.01, max_frames=None):
+        """
+        Args:
+            source: blocking frame source with read() and release()
+            executor (Executor | None): executor for read() calls; a private
+                single-thread executor is created (and shut down) if None
+            retry_delay_sec (float): pause after a failed read
+            max_frames (int | None): stop after this many frames
+        """
+        self.source = source
+        self.retry_delay_sec = retry_delay_sec
+        self.max_frames = max_frames
+
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="dms-capture"
+        )
+        self.frames_read = 0
+        self._closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._closed or (
+                self.max_frames is not None and self.frames_read >= self.max_frames
+            ):
+                raise StopAsyncIteration
+
+            frame = await loop.run_in_executor(self.executor, self.source.read)
+            if frame is not None:
+                self.frames_read += 1
+                return frame
+            await asyncio.sleep(self.retry_delay_sec)
+
+    async def aclose(self):
+        """
+        Stops iteration and releases the source.
+
+        release() is queued on the capture thread, so it only runs after any
+        in-flight read() has returned.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self.source.release)
+        if self._owns_executor:
+            self.executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+        return False
@@ -0,0 +1,59 @@
+from ..common.mapping import SlotMapping
+
+
+class Frame(SlotMapping):
+    """
+    A captured frame.
+
+    Attribute access (frame.image) is the fast path. The class is also a
+    read-only Mapping over the keys of the original dicts: "frame_id",
+    "timestamp_ms" and "image", plus "stream_timestamp_ms" for network
+    frames. So frame["image"], frame.get(...), dict(frame) and equality with
+    those dicts keep working. capture_monotonic_ns is an attribute only.
+
+    Attributes:
+        frame_id (int): sequence number assigned by the source
+        timestamp_ms (int): capture time on the source's clock
+        image (np.ndarray): BGR image
+        capture_monotonic_ns (int | None): time.monotonic_ns() at capture,
+            unaffected by wall-clock adjustments; use it for latency and
+            interval measurements
+        stream_timestamp_ms (float | None): position reported by a network
+            stream, if any
+    """
+
+    __slots__ = (
+        "frame_id",
+        "timestamp_ms",
+        "image",
+        "capture_monotonic_ns",
+        "stream_timestamp_ms",
+    )
+
+    _KEYS = ("frame_id", "timestamp_ms", "image")
+    _STREAM_KEYS = _KEYS + ("stream_timestamp_ms",)
+
+    def __init__(
+        self,
+        frame_id,
+        timestamp_ms,
+        image,
+        capture_monotonic_ns=None,
+        stream_timestamp_ms=None,
+    ):
+        self.frame_id = frame_id
+        self.timestamp_ms = timestamp_ms
+        self.image = image
+        self.capture_monotonic_ns = capture_monotonic_ns
+        self.stream_timestamp_ms = stream_timestamp_ms
+
+    def _keys(self):
+        if self.stream_timestamp_ms is None:
+            return self._KEYS
+        return self._STREAM_KEYS
+
+    def __repr__(self):
+        return (
+            f"Frame(frame_id={self.frame_id!r}, timestamp_ms={self.timestamp_ms!r}, "
+            f"capture_monotonic_ns={self.capture_monotonic_ns!r})"
+        )
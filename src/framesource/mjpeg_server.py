@@ -0,0 +1,147 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cv2
+
+BOUNDARY = "dmsframe"
+
+
+class MJPEGServer:
+    """
+    Local MJPEG-over-HTTP server that stands in for an IP cabin camera.
+
+    Serves a recorded clip (or a list of images) at `fps`, looping forever,
+    as multipart/x-mixed-replace on http://host:port/stream.mjpg. This lets
+    NetworkStreamFrameSource be exercised without hardware or a network.
+
+    Usage:
+        with MJPEGServer("drive.mp4", port=0) as server:
+            source = NetworkStreamFrameSource(server.url)
+    """
+
+    def __init__(self, clip, host="127.0.0.1", port=8080, fps=30.0, jpeg_quality=80):
+        """
+        Args:
+            clip (str | list[np.ndarray]): video file path or BGR images
+            host (str): interface to bind
+            port (int): TCP port, 0 picks a free one
+            fps (float): frame rate served to each client
+            jpeg_quality (int): JPEG quality, 0-100
+        """
+        self.fps = fps
+        self.jpeg_frames = [
+            _encode_jpeg(image, jpeg_quality) for image in _load_clip(clip)
+        ]
+        if not self.jpeg_frames:
+            raise ValueError("Clip has no frames")
+
+        self.pause_event = threading.Event()
+        self.pause_event.set()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/stream.mjpg"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="dms-mjpeg-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def pause(self):
+        """Stops sending frames to connected clients, simulating a stall."""
+        self.pause_event.clear()
+
+    def resume(self):
+        self.pause_event.set()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/stream.mjpg":
+                    self.send_error(404)
+                    return
+
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", f"multipart/x-mixed-replace; boundary={BOUNDARY}"
+                )
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+
+                period = 1.0 / server.fps
+                next_due = time.monotonic()
+                index = 0
+                try:
+                    while True:
+                        server.pause_event.wait()
+                        jpeg = server.jpeg_frames[index % len(server.jpeg_frames)]
+                        self.wfile.write(
+                            (
+                                f"--{BOUNDARY}\r\n"
+                                "Content-Type: image/jpeg\r\n"
+                                f"Content-Length: {len(jpeg)}\r\n\r\n"
+                            ).encode()
+                        )
+                        self.wfile.write(jpeg)
+                        self.wfile.write(b"\r\n")
+                        index += 1
+
+                        next_due += period
+                        delay = next_due - time.monotonic()
+                        if delay > 0:
+                            time.sleep(delay)
+                        else:
+                            next_due = time.monotonic()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _load_clip(clip):
+    if not isinstance(clip, str):
+        return list(clip)
+
+    cap = cv2.VideoCapture(clip)
+    frames = []
+    try:
+        while True:
+            ok, image = cap.read()
+            if not ok:
+                break
+            frames.append(image)
+    finally:
+        cap.release()
+    return frames
+
+
+def _encode_jpeg(image, quality):
+    ok, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("Could not encode frame as JPEG")
+    return buffer.tobytes()
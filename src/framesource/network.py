@@ -0,0 +1,187 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import cv2
+
+from .frame import Frame
+
+logger = logging.getLogger(__name__)
+
+# FFmpeg options that disable input buffering for RTSP/HTTP streams
+LOW_LATENCY_FFMPEG_OPTIONS = "rtsp_transport;tcp|fflags;nobuffer|flags;low_delay"
+
+
+class NetworkStreamFrameSource:
+    """
+    Frame source for IP cameras (RTSP, MJPEG over HTTP).
+
+    A background thread reads the stream as fast as it arrives so neither
+    OpenCV nor the network stack queues up stale frames. With
+    `drop_to_latest`, read() always returns the newest frame and older
+    unread frames are dropped; otherwise up to `buffer_size` frames are kept
+    in order. If the stream fails, the thread reconnects with exponential
+    backoff; errors raised while opening or reading are logged and handled
+    the same way.
+
+    Frames are the same `Frame` objects WebcamFrameSource returns, with
+    `timestamp_ms` and `capture_monotonic_ns` set to the arrival time, plus
+    `stream_timestamp_ms` (the position reported by the stream, if any).
+    """
+
+    def __init__(
+        self,
+        url,
+        drop_to_latest=True,
+        buffer_size=1,
+        read_timeout_sec=1.0,
+        reconnect_initial_delay_sec=0.5,
+        reconnect_max_delay_sec=10.0,
+        stream_timeout_sec=5.0,
+        ffmpeg_options=LOW_LATENCY_FFMPEG_OPTIONS,
+        clock=None,
+        capture_factory=None,
+    ):
+        """
+        Args:
+            url (str): stream URL, e.g. rtsp://... or http://.../stream.mjpg
+            drop_to_latest (bool): keep only the newest unread frame
+            buffer_size (int): frames kept when drop_to_latest is False
+            read_timeout_sec (float): how long read() waits for a new frame
+            reconnect_initial_delay_sec (float): first delay after a failure
+            reconnect_max_delay_sec (float): cap on the reconnect delay
+            stream_timeout_sec (float): open/read timeout after which a
+                silent stream is treated as failed and reconnected
+            ffmpeg_options (str | None): OPENCV_FFMPEG_CAPTURE_OPTIONS to use
+                when opening the stream. This is a process-wide setting and
+                is applied once, here.
+            clock (callable | None): returns the current time in seconds,
+                defaults to time.time
+            capture_factory (callable | None): opens a capture for `url`,
+                defaults to cv2.VideoCapture with the FFmpeg backend
+        """
+        self.url = url
+        self.drop_to_latest = drop_to_latest
+        self.read_timeout_sec = read_timeout_sec
+        self.reconnect_initial_delay_sec = reconnect_initial_delay_sec
+        self.reconnect_max_delay_sec = reconnect_max_delay_sec
+        self.stream_timeout_sec = stream_timeout_sec
+        self.ffmpeg_options = ffmpeg_options
+        self.clock = clock if clock is not None else time.time
+        self.capture_factory = capture_factory or self._open_ffmpeg_capture
+        if ffmpeg_options is not None:
+            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = ffmpeg_options
+
+        self.frame_id = 0
+        self.connected = False
+        self.frames_received = 0
+        self.frames_dropped = 0
+        self.reconnects = 0
+
+        self._frames = deque(maxlen=1 if drop_to_latest else buffer_size)
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="dms-network-capture", daemon=True
+        )
+        self._thread.start()
+
+    def read(self):
+        """
+        Returns the next frame, or None if none arrived within
+        read_timeout_sec.
+        """
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._frames or self._stop.is_set(), self.read_timeout_sec
+            ):
+                return None
+            if not self._frames:
+                return None
+            arrival_ms, arrival_ns, stream_ms, image = self._frames.popleft()
+
+        frame = Frame(
+            self.frame_id,
+            arrival_ms,
+            image,
+            capture_monotonic_ns=arrival_ns,
+            stream_timestamp_ms=stream_ms,
+        )
+        self.frame_id += 1
+        return frame
+
+    def release(self):
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        # A blocked read gives up after stream_timeout_sec
+        self._thread.join(timeout=self.stream_timeout_sec + 1.0)
+
+    def _run(self):
+        delay = self.reconnect_initial_delay_sec
+        while not self._stop.is_set():
+            try:
+                cap = self._open()
+            except Exception:
+                logger.exception("Could not open stream %s", self.url)
+                cap = None
+            if cap is None:
+                self._stop.wait(delay)
+                delay = min(delay * 2, self.reconnect_max_delay_sec)
+                continue
+
+            self.connected = True
+            try:
+                self._read_until_failure(cap)
+                delay = self.reconnect_initial_delay_sec
+            except Exception:
+                logger.exception("Could not read stream %s", self.url)
+                # Back off as after a failed open, so a stream that opens but
+                # always errors is not reopened in a tight loop
+                self._stop.wait(delay)
+                delay = min(delay * 2, self.reconnect_max_delay_sec)
+            finally:
+                self.connected = False
+                cap.release()
+
+            if not self._stop.is_set():
+                self.reconnects += 1
+
+    def _open(self):
+        cap = self.capture_factory(self.url)
+        if not cap.isOpened():
+            cap.release()
+            return None
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return cap
+
+    def _read_until_failure(self, cap):
+        while not self._stop.is_set():
+            ok, image = cap.read()
+            if not ok:
+                return
+
+            arrival_ms = int(self.clock() * 1000)
+            arrival_ns = time.monotonic_ns()
+            stream_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
+            with self._cond:
+                if len(self._frames) == self._frames.maxlen:
+                    self.frames_dropped += 1
+                self._frames.append((arrival_ms, arrival_ns, stream_ms, image))
+                self.frames_received += 1
+                self._cond.notify()
+
+    def _open_ffmpeg_capture(self, url):
+        timeout_ms = int(self.stream_timeout_sec * 1000)
+        return cv2.VideoCapture(
+            url,
+            cv2.CAP_FFMPEG,
+            [
+                cv2.CAP_PROP_OPEN_TIMEOUT_MSEC,
+                timeout_ms,
+                cv2.CAP_PROP_READ_TIMEOUT_MSEC,
+                timeout_ms,
+            ],
+        )
@@ -0,0 +1,306 @@
+import time
+
+import numpy as np
+
+NUM_LANDMARKS = 468
+
+# FaceMesh indices of the six EAR points per eye, same order as src/main.py
+LEFT_EYE_IDX = [33, 160, 158, 133, 153, 144]
+RIGHT_EYE_IDX = [362, 385, 387, 263, 373, 380]
+
+EYE_WIDTH = 0.05
+LEFT_EYE_CENTER = (0.44, 0.45)
+RIGHT_EYE_CENTER = (0.56, 0.45)
+
+
+class SyntheticLandmarkStream:
+    """
+    Generates FaceMesh-shaped landmark and EAR streams without a camera.
+
+    The stream mixes the situations the pipeline sees on the road: open eyes
+    with sensor noise, short blinks, microsleeps long enough to trigger a
+    DROWSY decision, head movement, face dropouts and jittered timestamps.
+    All randomness comes from `seed`, so a stream can be replayed exactly.
+    """
+
+    def __init__(
+        self,
+        fps=30.0,
+        seed=None,
+        open_ear=0.45,
+        closed_ear=0.08,
+        ear_noise=0.01,
+        blink_rate_hz=0.3,
+        blink_duration_ms=(100, 300),
+        microsleep_rate_hz=0.01,
+        microsleep_duration_ms=(1500, 4000),
+        dropout_rate_hz=0.02,
+        dropout_duration_ms=(200, 2000),
+        head_motion=0.02,
+        timestamp_jitter_ms=3.0,
+        start_ms=0,
+    ):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+
+        self.fps = fps
+        self.seed = seed
+        self.open_ear = open_ear
+        self.closed_ear = closed_ear
+        self.ear_noise = ear_noise
+        self.blink_rate_hz = blink_rate_hz
+        self.blink_duration_ms = blink_duration_ms
+        self.microsleep_rate_hz = microsleep_rate_hz
+        self.microsleep_duration_ms = microsleep_duration_ms
+        self.dropout_rate_hz = dropout_rate_hz
+        self.dropout_duration_ms = dropout_duration_ms
+        self.head_motion = head_motion
+        self.timestamp_jitter_ms = timestamp_jitter_ms
+        self.start_ms = start_ms
+
+        self.rng = np.random.default_rng(seed)
+        self._base_face = self._make_base_face()
+
+    def generate(self, num_frames):
+        """
+        Generates a stream as NumPy arrays, for throughput and soak tests.
+
+        Args:
+            num_frames (int): number of frames to generate
+
+        Returns:
+            dict: {
+                "timestamp_ms": np.ndarray[int64],
+                "ear": np.ndarray[float64] (NaN where no face),
+                "face_detected": np.ndarray[bool],
+                "head_offset": np.ndarray[float64] of shape (num_frames, 2),
+                "events": list[{"kind", "start_ms", "end_ms"}]
+            }
+        """
+        period_ms = 1000.0 / self.fps
+        nominal_ms = self.start_ms + np.arange(num_frames) * period_ms
+        duration_ms = num_frames * period_ms
+
+        # Keep jitter within half a period so timestamps stay strictly increasing
+        max_jitter = 0.45 * period_ms
+        jitter = np.clip(
+            self.rng.normal(0.0, self.timestamp_jitter_ms, num_frames),
+            -max_jitter,
+            max_jitter,
+        )
+        timestamp_ms = np.rint(nominal_ms + jitter).astype(np.int64)
+
+        ear = self.open_ear + self.rng.normal(0.0, self.ear_noise, num_frames)
+        events = []
+
+        for kind, rate_hz, duration_range in (
+            ("blink", self.blink_rate_hz, self.blink_duration_ms),
+            ("microsleep", self.microsleep_rate_hz, self.microsleep_duration_ms),
+        ):
+            starts, ends = self._sample_intervals(rate_hz, duration_range, duration_ms)
+            closed = self._interval_mask(nominal_ms, starts, ends)
+            ear[closed] = self.closed_ear + self.rng.normal(
+                0.0, self.ear_noise, int(closed.sum())
+            )
+            events.extend(self._events(kind, starts, ends))
+
+        starts, ends = self._sample_intervals(
+            self.dropout_rate_hz, self.dropout_duration_ms, duration_ms
+        )
+        face_detected = ~self._interval_mask(nominal_ms, starts, ends)
+        events.extend(self._events("dropout", starts, ends))
+
+        ear = np.clip(ear, 0.0, None)
+        ear[~face_detected] = np.nan
+
+        events.sort(key=lambda event: event["start_ms"])
+
+        return {
+            "timestamp_ms": timestamp_ms,
+            "ear": ear,
+            "face_detected": face_detected,
+            "head_offset": self._head_offset(nominal_ms),
+            "events": events,
+        }
+
+    def frames(self, num_frames, clock=None):
+        """
+        Yields frames in the shape produced by the frame source and the
+        landmark extractor combined.
+
+        Args:
+            num_frames (int): number of frames to yield
+            clock (callable | None): optional clock with a `sleep(seconds)`
+                method. When given, frames are paced and stamped with it,
+                like WebcamFrameSource would; use an AcceleratedClock to run
+                faster than real time.
+
+        Yields:
+            dict: {
+                "frame_id": int,
+                "timestamp_ms": int,
+                "face_detected": bool,
+                "landmarks": list[{"x","y","z"}] | None,
+                "ear": float | None
+            }
+        """
+        data = self.generate(num_frames)
+        period_sec = 1.0 / self.fps
+        clock_start = clock() if clock is not None else None
+
+        for frame_id in range(num_frames):
+            timestamp_ms = int(data["timestamp_ms"][frame_id])
+            if clock is not None:
+                clock.sleep(clock_start + frame_id * period_sec - clock())
+                jitter_ms = timestamp_ms - (
+                    self.start_ms + frame_id * period_sec * 1000
+                )
+                timestamp_ms = int(clock() * 1000 + jitter_ms)
+
+            if data["face_detected"][frame_id]:
+                ear = float(data["ear"][frame_id])
+                dx, dy = data["head_offset"][frame_id]
+                landmarks = self.build_landmarks(ear, dx, dy)
+            else:
+                ear = None
+                landmarks = None
+
+            yield {
+                "frame_id": frame_id,
+                "timestamp_ms": timestamp_ms,
+                "face_detected": landmarks is not None,
+                "landmarks": landmarks,
+                "ear": ear,
+            }
+
+    def build_landmarks(self, ear, dx=0.0, dy=0.0):
+        """
+        Builds 468 landmarks whose eyes have the given EAR.
+
+        Args:
+            ear (float): target Eye Aspect Ratio for both eyes
+            dx (float): horizontal head offset (normalized)
+            dy (float): vertical head offset (normalized)
+
+        Returns:
+            list[{"x","y","z"}]
+        """
+        points = self._base_face.copy()
+        for eye_idx, (cx, cy) in (
+            (LEFT_EYE_IDX, LEFT_EYE_CENTER),
+            (RIGHT_EYE_IDX, RIGHT_EYE_CENTER),
+        ):
+            points[eye_idx, :2] = _eye_points(cx, cy, EYE_WIDTH, ear)
+
+        points[:, 0] += dx
+        points[:, 1] += dy
+
+        return [{"x": x, "y": y, "z": z} for x, y, z in points.tolist()]
+
+    def _make_base_face(self):
+        # Points scattered over an ellipse around the image center
+        angle = self.rng.uniform(0.0, 2.0 * np.pi, NUM_LANDMARKS)
+        radius = np.sqrt(self.rng.uniform(0.0, 1.0, NUM_LANDMARKS))
+        points = np.empty((NUM_LANDMARKS, 3))
+        points[:, 0] = 0.5 + 0.12 * radius * np.cos(angle)
+        points[:, 1] = 0.5 + 0.16 * radius * np.sin(angle)
+        points[:, 2] = self.rng.normal(0.0, 0.02, NUM_LANDMARKS)
+        return points
+
+    def _sample_intervals(self, rate_hz, duration_range, duration_ms):
+        count = self.rng.poisson(rate_hz * duration_ms / 1000.0)
+        starts = np.sort(
+            self.rng.uniform(self.start_ms, self.start_ms + duration_ms, count)
+        )
+        ends = starts + self.rng.uniform(duration_range[0], duration_range[1], count)
+        return starts, ends
+
+    def _head_offset(self, nominal_ms):
+        # Slow sway made of two sinusoids with random frequency and phase
+        t = (nominal_ms - self.start_ms)[:, None] / 1000.0
+        freq = self.rng.uniform(0.05, 0.5, (2, 2))
+        phase = self.rng.uniform(0.0, 2.0 * np.pi, (2, 2))
+        offset = np.zeros((len(nominal_ms), 2))
+        for k in range(2):
+            offset += np.sin(2.0 * np.pi * freq[k] * t + phase[k])
+        return offset * (self.head_motion / 2.0)
+
+    @staticmethod
+    def _interval_mask(nominal_ms, starts, ends):
+        delta = np.zeros(len(nominal_ms) + 1, dtype=np.int64)
+        np.add.at(delta, np.searchsorted(nominal_ms, starts), 1)
+        np.add.at(delta, np.searchsorted(nominal_ms, ends), -1)
+        return np.cumsum(delta[:-1]) > 0
+
+    @staticmethod
+    def _events(kind, starts, ends):
+        return [
+            {"kind": kind, "start_ms": int(start), "end_ms": int(end)}
+            for start, end in zip(starts, ends)
+        ]
+
+
+def _eye_points(cx, cy, width, ear):
+    # p2-p6 and p3-p5 are both `height` apart, p1-p4 is `width` apart,
+    # so compute_ear() returns height / width
+    half_w = width / 2.0
+    half_h = ear * width / 2.0
+    return [
+        (cx - half_w, cy),
+        (cx - width / 6.0, cy - half_h),
+        (cx + width / 6.0, cy - half_h),
+        (cx + half_w, cy),
+        (cx + width / 6.0, cy + half_h),
+        (cx - width / 6.0, cy + half_h),
+    ]
+
+
+def run_decision_load(engine, stream, num_frames):
+    """
+    Drives a decision engine with a synthetic stream as fast as possible.
+
+    Frames without a face are skipped, as in src/main.py.
+
+    Args:
+        engine: object with update(ear, timestamp_ms)
+        stream (SyntheticLandmarkStream): source of EAR samples
+        num_frames (int): number of frames to generate
+
+    Returns:
+        dict: {
+            "frames": int,
+            "updates": int,
+            "drowsy_frames": int,
+            "elapsed_sec": float,
+            "frames_per_sec": float,
+            "speedup": float (simulated time / wall time)
+        }
+    """
+    data = stream.generate(num_frames)
+    timestamps = data["timestamp_ms"].tolist()
+    ears = data["ear"].tolist()
+    detected = data["face_detected"].tolist()
+
+    updates = 0
+    drowsy_frames = 0
+
+    start = time.perf_counter()
+    for timestamp_ms, ear, face_detected in zip(timestamps, ears, detected):
+        if not face_detected:
+            continue
+        decision = engine.update(ear=ear, timestamp_ms=timestamp_ms)
+        updates += 1
+        if decision["state"] == "DROWSY":
+            drowsy_frames += 1
+    elapsed_sec = time.perf_counter() - start
+
+    simulated_sec = (timestamps[-1] - timestamps[0]) / 1000.0 if timestamps else 0.0
+
+    return {
+        "frames": num_frames,
+        "updates": updates,
+        "drowsy_frames": drowsy_frames,
+        "elapsed_sec": elapsed_sec,
+        "frames_per_sec": num_frames / elapsed_sec if elapsed_sec > 0 else 0.0,
+        "speedup": simulated_sec / elapsed_sec if elapsed_sec > 0 else 0.0,
+    }
@@ -2,30 +2,189 @@ import time
 
 import cv2
 
+from .frame import Frame
+
+# Grabs faster than this returned a frame already queued by the driver
+_FRESH_GRAB_SEC = 0.002
+
 
 class WebcamFrameSource:
-    def __init__(self, device_index=0):
+    """
+    Frame source for a local camera.
+
+    A failed read does not return immediately: read() waits with exponential
+    backoff before returning None, so a caller that retries in a loop does
+    not spin a core while the camera is stalled. The wait blocks the caller
+    and is bounded by `retry_max_delay_sec`; together with the read timeout
+    this bounds how long one read() may take. If no frame arrives for
+    `stall_timeout_sec`, the device is released and reopened, and again
+    every `stall_timeout_sec` until frames resume. health() reports the
+    stall metrics for the decision engine and for logging.
+
+    Frame timestamps come from `clock`; the backoff and stall intervals are
+    measured on `monotonic_clock`, so wall-clock adjustments neither fake
+    nor hide a stall.
+
+    With `max_fps` set (the frame loop is paced below the camera rate), the
+    camera is asked for that rate and a one-frame buffer, and read() grabs
+    past frames the driver has already queued, so the returned frame is the
+    newest one and its timestamp matches when it was captured.
+    """
+
+    def __init__(
+        self,
+        device_index=0,
+        clock=None,
+        monotonic_clock=None,
+        read_timeout_sec=1.0,
+        retry_initial_delay_sec=0.01,
+        retry_max_delay_sec=0.5,
+        stall_timeout_sec=2.0,
+        max_fps=None,
+        max_stale_grabs=4,
+        timer=time.perf_counter,
+    ):
+        """
+        Args:
+            device_index (int): OpenCV camera index
+            clock (callable | None): returns the current time in seconds,
+                defaults to time.time. Inject an accelerated or simulated clock
+                to run the pipeline faster than real time.
+            monotonic_clock (callable | None): returns seconds on a clock
+                that never jumps, defaults to time.monotonic. Used for the
+                backoff and stall intervals; its sleep() method, if any, is
+                used for the backoff wait.
+            read_timeout_sec (float): how long a single read may block, on
+                backends that support CAP_PROP_READ_TIMEOUT_MSEC
+            retry_initial_delay_sec (float): wait after the first failed read
+            retry_max_delay_sec (float): cap on the wait between failed
+                reads, and so on how long read() blocks after a failure
+            stall_timeout_sec (float): time without frames after which the
+                camera counts as stalled and is reopened
+            max_fps (float | None): rate the frame loop consumes frames at;
+                None reads frames as the camera delivers them
+            max_stale_grabs (int): with max_fps set, most queued frames
+                skipped per read()
+            timer (callable): high-resolution clock in seconds used to time
+                grabs, defaults to time.perf_counter
+        """
+        self.device_index = device_index
+        self.clock = clock if clock is not None else time.time
+        self.monotonic_clock = (
+            monotonic_clock if monotonic_clock is not None else time.monotonic
+        )
+        self.read_timeout_sec = read_timeout_sec
+        self.retry_initial_delay_sec = retry_initial_delay_sec
+        self.retry_max_delay_sec = retry_max_delay_sec
+        self.stall_timeout_sec = stall_timeout_sec
+        self.max_fps = max_fps
+        self.max_stale_grabs = max_stale_grabs
+        self.timer = timer
+
         self.cap = cv2.VideoCapture(device_index)
         if not self.cap.isOpened():
             raise RuntimeError(
                 "Could not open webcam. Try device_index=1 if you have multiple cameras."
             )
+        self._configure()
 
         self.frame_id = 0
+        self.stalled = False
+        self.stall_count = 0
+        self.reopens = 0
+        self.consecutive_failures = 0
+
+        self._retry_delay = retry_initial_delay_sec
+        self._last_frame_sec = self.monotonic_clock()
+        self._last_reopen_sec = self._last_frame_sec
 
     def read(self):
-        ok, frame_bgr = self.cap.read()
+        """
+        Returns the next frame, or None after a failed read and its backoff
+        delay.
+        """
+        ok, frame_bgr = self._read_latest()
         if not ok:
+            self._on_failure()
             return None
 
-        frame = {
-            "frame_id": self.frame_id,
-            "timestamp_ms": int(time.time() * 1000),
-            "image": frame_bgr,
-        }
+        self.stalled = False
+        self.consecutive_failures = 0
+        self._retry_delay = self.retry_initial_delay_sec
+        self._last_frame_sec = self.monotonic_clock()
+
+        frame = Frame(
+            self.frame_id,
+            int(self.clock() * 1000),
+            frame_bgr,
+            capture_monotonic_ns=time.monotonic_ns(),
+        )
 
         self.frame_id += 1
         return frame
 
+    def health(self):
+        """
+        Returns:
+            dict: {
+                "stalled": bool,
+                "time_without_frames_sec": float,
+                "stall_count": int,
+                "reopens": int,
+                "consecutive_failures": int
+            }
+        """
+        return {
+            "stalled": self.stalled,
+            "time_without_frames_sec": self.monotonic_clock() - self._last_frame_sec,
+            "stall_count": self.stall_count,
+            "reopens": self.reopens,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
     def release(self):
         self.cap.release()
+
+    def _on_failure(self):
+        self.consecutive_failures += 1
+        now_sec = self.monotonic_clock()
+
+        if now_sec - self._last_frame_sec >= self.stall_timeout_sec:
+            if not self.stalled:
+                self.stalled = True
+                self.stall_count += 1
+            if now_sec - self._last_reopen_sec >= self.stall_timeout_sec:
+                self._reopen()
+                self._last_reopen_sec = now_sec
+
+        getattr(self.monotonic_clock, "sleep", time.sleep)(self._retry_delay)
+        self._retry_delay = min(self._retry_delay * 2, self.retry_max_delay_sec)
+
+    def _reopen(self):
+        self.cap.release()
+        self.cap = cv2.VideoCapture(self.device_index)
+        self.reopens += 1
+        # A failed reopen is retried on the next stall timeout
+        if self.cap.isOpened():
+            self._configure()
+
+    def _configure(self):
+        # Best effort: backends without support for a property ignore it
+        self.cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, int(self.read_timeout_sec * 1000))
+        if self.max_fps is not None:
+            self.cap.set(cv2.CAP_PROP_FPS, self.max_fps)
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    def _read_latest(self):
+        if self.max_fps is None:
+            return self.cap.read()
+
+        # A queued frame is grabbed almost instantly; a grab that has to
+        # wait for the sensor means the driver queue is empty
+        for _ in range(self.max_stale_grabs + 1):
+            start = self.timer()
+            if not self.cap.grab():
+                return False, None
+            if self.timer() - start >= _FRESH_GRAB_SEC:
+                break
+        return self.cap.retrieve()
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from .result import NO_FACE, LandmarkResult
+
+
+class LandmarkCache:
+    """
+    Size-bounded on-disk cache of landmark arrays.
+
+    Entries are stored as float32 .npy files (a no-face result is an empty
+    array) under a directory named after the hash of the extractor
+    configuration, so changing any extractor parameter never returns stale
+    landmarks. When the cache grows past `max_bytes`, the least recently
+    used entries are evicted first, across all configurations.
+    """
+
+    def __init__(self, cache_dir, config, max_bytes=1024**3):
+        """
+        Args:
+            cache_dir (str): root directory of the cache
+            config (dict): JSON-serializable extractor configuration
+            max_bytes (int): upper bound on the total size of cached entries
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.config_hash = _hash_text(json.dumps(config, sort_keys=True))[:16]
+        self.config_dir = os.path.join(cache_dir, self.config_hash)
+        os.makedirs(self.config_dir, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self.total_bytes = sum(size for _, size, _ in self._entries())
+
+    def get(self, key):
+        """
+        Returns:
+            np.ndarray | None: (N, 3) float32 landmarks, (0, 3) if no face
+            was detected, or None if the key is not cached
+        """
+        path = self._path(key)
+        try:
+            landmarks = np.load(path)
+        except (OSError, ValueError, EOFError):
+            # Missing, or left empty or truncated by an interrupted run
+            self.misses += 1
+            return None
+
+        # Refresh the access time used for LRU eviction
+        os.utime(path)
+        self.hits += 1
+        return landmarks
+
+    def put(self, key, landmarks):
+        """
+        Args:
+            key (str): entry key, see frame_key() and image_key()
+            landmarks (np.ndarray): (N, 3) landmarks, (0, 3) if no face
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        # Written to a temporary file first so get() never sees a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.asarray(landmarks, dtype=np.float32))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        self.total_bytes += os.path.getsize(path) - old_size
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self, target_bytes=None):
+        """Removes least recently used entries until under target_bytes."""
+        if target_bytes is None:
+            # Evict down to 90% so the next few writes don't evict again
+            target_bytes = int(self.max_bytes * 0.9)
+
+        for path, size, _ in sorted(self._entries(), key=lambda entry: entry[2]):
+            if self.total_bytes <= target_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.total_bytes -= size
+
+    def _path(self, key):
+        return os.path.join(self.config_dir, key[:2], f"{key}.npy")
+
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".npy"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+
+class CachedLandmarkExtractor:
+    """
+    Wraps a landmark extractor with a LandmarkCache for offline runs.
+
+    Frames are keyed by (video_id, frame_index) when both are known, which
+    avoids hashing the image, and by a hash of the image content otherwise.
+    Re-running feature or decision experiments over cached recordings only
+    reads small arrays from disk instead of running inference.
+
+    Results that depend on previous frames (the extractor's no-face backoff)
+    are only reproducible if the recording is replayed in the same order;
+    disable backoff (backoff_after_misses=None) when filling a cache.
+    """
+
+    def __init__(self, extractor, cache_dir, max_bytes=1024**3):
+        self.extractor = extractor
+        self.cache = LandmarkCache(cache_dir, extractor.config, max_bytes=max_bytes)
+
+    def extract(self, image_bgr, video_id=None, frame_index=None):
+        """
+        Args:
+            image_bgr (np.ndarray): BGR image from OpenCV
+            video_id (str | None): identity of the recording, e.g. a file
+                hash or a path plus modification time
+            frame_index (int | None): index of the frame in the recording
+
+        Returns:
+            LandmarkResult: same as the wrapped extractor's extract()
+        """
+        if video_id is not None and frame_index is not None:
+            key = frame_key(video_id, frame_index)
+        else:
+            key = image_key(image_bgr)
+
+        landmarks = self.cache.get(key)
+        if landmarks is not None:
+            if len(landmarks) == 0:
+                return NO_FACE
+            return LandmarkResult(
+                True, [{"x": x, "y": y, "z": z} for x, y, z in landmarks.tolist()]
+            )
+
+        result = self.extractor.extract(image_bgr)
+        # FaceMesh landmarks are float32 internally, so float32 storage is lossless
+        if result["face_detected"]:
+            array = [[lm["x"], lm["y"], lm["z"]] for lm in result["landmarks"]]
+        else:
+            array = np.empty((0, 3))
+        self.cache.put(key, array)
+        return result
+
+    def close(self):
+        self.extractor.close()
+
+
+def frame_key(video_id, frame_index):
+    """Cache key for a frame identified by its recording and index."""
+    return _hash_text(f"{video_id}\0{frame_index}")
+
+
+def image_key(image):
+    """Cache key derived from the content of an image."""
+    image = np.ascontiguousarray(image)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr((image.shape, image.dtype.str)).encode())
+    digest.update(image.data)
+    return digest.hexdigest()
+
+
+def _hash_text(text):
+    return hashlib.blake2b(text.encode(), digest_size=20).hexdigest()
@@ -0,0 +1,191 @@
+import cv2
+import numpy as np
+
+from .result import LandmarkResult
+
+
+class EyeLandmarkTracker:
+    """
+    Tracks only the eye landmarks between full landmark extractions.
+
+    After a full extraction, up to `max_tracked_frames` frames are served by
+    pyramidal Lucas-Kanade optical flow on small grayscale patches around
+    each eye, instead of running the full face mesh. Only the landmarks in
+    `eye_groups` move; all other landmarks keep the values of the last full
+    extraction.
+
+    Each tracked point is also tracked backwards; the largest
+    forward-backward distance is the tracking error. A full extraction runs
+    again when the error exceeds `max_error_px`, a point is lost, or
+    `max_tracked_frames` is reached.
+    """
+
+    def __init__(
+        self,
+        extractor,
+        eye_groups,
+        max_tracked_frames=3,
+        max_error_px=1.0,
+        patch_margin=0.5,
+        win_size=(11, 11),
+        max_level=1,
+    ):
+        """
+        Args:
+            extractor: full landmark extractor with extract(image_bgr)
+            eye_groups (list[list[int]]): landmark indices of each eye; each
+                group is tracked in its own patch
+            max_tracked_frames (int): frames tracked before a full extraction
+            max_error_px (float): forward-backward error, in pixels, above
+                which tracking is abandoned
+            patch_margin (float): margin around each eye, as a fraction of
+                the eye width
+            win_size (tuple[int, int]): Lucas-Kanade search window
+            max_level (int): Lucas-Kanade pyramid levels
+        """
+        self.extractor = extractor
+        self.eye_groups = [list(group) for group in eye_groups]
+        self.max_tracked_frames = max_tracked_frames
+        self.max_error_px = max_error_px
+        self.patch_margin = patch_margin
+        self.win_size = tuple(win_size)
+        self.max_level = max_level
+
+        self.full_runs = 0
+        self.tracked_frames = 0
+        self.tracking_failures = 0
+        self.tracking_error_px = None
+
+        self._landmarks = None
+        self._patches = None
+        self._frames_since_full = 0
+
+    def extract(self, image_bgr):
+        """
+        Args:
+            image_bgr (np.ndarray): BGR image from OpenCV
+
+        Returns:
+            LandmarkResult: as returned by the full extractor, or with
+            tracked eye landmarks
+        """
+        if self._landmarks is not None and (
+            self._frames_since_full < self.max_tracked_frames
+        ):
+            result = self._track(image_bgr)
+            if result is not None:
+                self._frames_since_full += 1
+                self.tracked_frames += 1
+                return result
+            self.tracking_failures += 1
+
+        return self._extract_full(image_bgr)
+
+    def close(self):
+        self.extractor.close()
+
+    def _extract_full(self, image_bgr):
+        result = self.extractor.extract(image_bgr)
+        self.full_runs += 1
+        self._frames_since_full = 0
+        self.tracking_error_px = None
+
+        if not result["face_detected"]:
+            self._landmarks = None
+            self._patches = None
+            return result
+
+        self._landmarks = result["landmarks"]
+        height, width = image_bgr.shape[:2]
+        self._patches = []
+        for group in self.eye_groups:
+            points = np.array(
+                [
+                    [
+                        self._landmarks[idx]["x"] * width,
+                        self._landmarks[idx]["y"] * height,
+                    ]
+                    for idx in group
+                ],
+                dtype=np.float32,
+            )
+            patch = self._crop(image_bgr, points)
+            if patch is None:
+                # Eye at the image border; nothing to track from
+                self._landmarks = None
+                self._patches = None
+                break
+            self._patches.append(patch + (points,))
+        return result
+
+    def _track(self, image_bgr):
+        height, width = image_bgr.shape[:2]
+        landmarks = list(self._landmarks)
+        patches = []
+        error_px = 0.0
+
+        for group, (x0, y0, prev_gray, points) in zip(self.eye_groups, self._patches):
+            gray = cv2.cvtColor(
+                image_bgr[y0 : y0 + prev_gray.shape[0], x0 : x0 + prev_gray.shape[1]],
+                cv2.COLOR_BGR2GRAY,
+            )
+            if gray.shape != prev_gray.shape:
+                return None
+
+            local = points - np.array([x0, y0], dtype=np.float32)
+            moved, status, _ = cv2.calcOpticalFlowPyrLK(
+                prev_gray,
+                gray,
+                local,
+                None,
+                winSize=self.win_size,
+                maxLevel=self.max_level,
+            )
+            back, back_status, _ = cv2.calcOpticalFlowPyrLK(
+                gray,
+                prev_gray,
+                moved,
+                None,
+                winSize=self.win_size,
+                maxLevel=self.max_level,
+            )
+            if not (status.all() and back_status.all()):
+                return None
+            error_px = max(error_px, float(np.linalg.norm(back - local, axis=1).max()))
+            if error_px > self.max_error_px:
+                self.tracking_error_px = error_px
+                return None
+
+            points = moved + np.array([x0, y0], dtype=np.float32)
+            for idx, (x, y) in zip(group, points.tolist()):
+                landmarks[idx] = {
+                    "x": x / width,
+                    "y": y / height,
+                    "z": landmarks[idx]["z"],
+                }
+            # Next frame is tracked from this one, in a patch re-centred on the eye
+            patch = self._crop(image_bgr, points)
+            if patch is None:
+                return None
+            patches.append(patch + (points,))
+
+        self.tracking_error_px = error_px
+        self._landmarks = landmarks
+        self._patches = patches
+        return LandmarkResult(True, landmarks)
+
+    def _crop(self, image_bgr, points):
+        """Returns (x0, y0, gray patch) around `points`, or None if too small."""
+        height, width = image_bgr.shape[:2]
+        (min_x, min_y), (max_x, max_y) = points.min(axis=0), points.max(axis=0)
+        margin = max((max_x - min_x) * self.patch_margin, float(max(self.win_size)))
+
+        x0 = max(int(min_x - margin), 0)
+        y0 = max(int(min_y - margin), 0)
+        x1 = min(int(max_x + margin) + 1, width)
+        y1 = min(int(max_y + margin) + 1, height)
+        if x1 - x0 < self.win_size[0] or y1 - y0 < self.win_size[1]:
+            return None
+
+        gray = cv2.cvtColor(image_bgr[y0:y1, x0:x1], cv2.COLOR_BGR2GRAY)
+        return x0, y0, gray
@@ -1,6 +1,8 @@
 import cv2
 import mediapipe as mp
 
+from .result import NO_FACE, LandmarkResult
+
 
 class MediaPipeFaceMeshExtractor:
     def __init__(
@@ -8,7 +10,43 @@ class MediaPipeFaceMeshExtractor:
         max_num_faces=1,
         min_detection_confidence=0.5,
         min_tracking_confidence=0.5,
+        backoff_after_misses=15,
+        probe_every=5,
+        probe_scale=0.5,
     ):
+        """
+        Args:
+            max_num_faces (int): maximum number of faces FaceMesh looks for
+            min_detection_confidence (float): FaceMesh detection threshold
+            min_tracking_confidence (float): FaceMesh tracking threshold
+            backoff_after_misses (int | None): consecutive frames without a
+                face before entering backoff; None disables backoff
+            probe_every (int): while in backoff, run FaceMesh on one frame
+                out of every `probe_every`
+            probe_scale (float): while in backoff, downscale probed frames
+                by this factor
+        """
+        self.backoff_after_misses = backoff_after_misses
+        self.probe_every = probe_every
+        self.probe_scale = probe_scale
+
+        # Everything that can change the landmarks produced for a frame
+        self.config = {
+            "extractor": type(self).__name__,
+            "mediapipe_version": getattr(mp, "__version__", None),
+            "max_num_faces": max_num_faces,
+            "refine_landmarks": False,
+            "min_detection_confidence": min_detection_confidence,
+            "min_tracking_confidence": min_tracking_confidence,
+            "backoff_after_misses": backoff_after_misses,
+            "probe_every": probe_every,
+            "probe_scale": probe_scale,
+        }
+
+        self.consecutive_misses = 0
+        self.backoff = False
+        self._frames_since_probe = 0
+
         self.mp_face_mesh = mp.solutions.face_mesh
 
         self.face_mesh = self.mp_face_mesh.FaceMesh(
@@ -21,24 +59,48 @@ class MediaPipeFaceMeshExtractor:
 
     def extract(self, image_bgr):
         """
+        While in backoff (no face for `backoff_after_misses` frames), most
+        frames are skipped and reported as no face; the rest are probed at
+        reduced resolution. Full-rate tracking resumes as soon as a probe
+        finds a face.
+
         Args:
             image_bgr (np.ndarray): BGR image from OpenCV
 
         Returns:
-            dict:
-                {
-                  "face_detected": bool,
-                  "landmarks": list[{"x","y","z"}] | None
-                }
+            LandmarkResult: face_detected and landmarks
+                (list[{"x","y","z"}] | None)
         """
+        if self.backoff:
+            self._frames_since_probe += 1
+            if self._frames_since_probe < self.probe_every:
+                return NO_FACE
+            self._frames_since_probe = 0
+            # Landmarks are normalized, so a downscaled probe needs no rescaling
+            image_bgr = cv2.resize(
+                image_bgr,
+                None,
+                fx=self.probe_scale,
+                fy=self.probe_scale,
+                interpolation=cv2.INTER_AREA,
+            )
+
         image_rgb = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
         results = self.face_mesh.process(image_rgb)
 
         if not results.multi_face_landmarks:
-            return {
-                "face_detected": False,
-                "landmarks": None,
-            }
+            self.consecutive_misses += 1
+            if (
+                self.backoff_after_misses is not None
+                and self.consecutive_misses >= self.backoff_after_misses
+                and not self.backoff
+            ):
+                self.backoff = True
+                self._frames_since_probe = 0
+            return NO_FACE
+
+        self.consecutive_misses = 0
+        self.backoff = False
 
         face_landmarks = results.multi_face_landmarks[0]
 
@@ -51,10 +113,7 @@ class MediaPipeFaceMeshExtractor:
             for lm in face_landmarks.landmark
         ]
 
-        return {
-            "face_detected": True,
-            "landmarks": landmarks,
-        }
+        return LandmarkResult(True, landmarks)
 
     def close(self):
         self.face_mesh.close()
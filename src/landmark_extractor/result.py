@@ -0,0 +1,34 @@
+from ..common.mapping import SlotMapping
+
+
+class LandmarkResult(SlotMapping):
+    """
+    Landmarks extracted from one frame.
+
+    Attribute access (result.landmarks) is the fast path. The class is also
+    a read-only Mapping, so result["face_detected"] and comparisons with the
+    original dict contract keep working. Instances may be shared between
+    frames (see NO_FACE) and must not be modified.
+
+    Attributes:
+        face_detected (bool): whether a face was found
+        landmarks (list[{"x","y","z"}] | None): normalized landmarks
+    """
+
+    __slots__ = ("face_detected", "landmarks")
+
+    _KEYS = __slots__
+
+    def __init__(self, face_detected, landmarks=None):
+        self.face_detected = face_detected
+        self.landmarks = landmarks
+
+    def __repr__(self):
+        count = None if self.landmarks is None else len(self.landmarks)
+        return (
+            f"LandmarkResult(face_detected={self.face_detected!r}, landmarks={count})"
+        )
+
+
+# Returned for every frame without a face, so those frames allocate nothing
+NO_FACE = LandmarkResult(False, None)
@@ -1,43 +1,123 @@
+import logging
+import os
+import sys
+
 import cv2
 
-from decision_engine.time_consecutive import TimeConsecutiveDecisionEngine
-from feature_extractor.ear import compute_ear
-from framesource.webcam import WebcamFrameSource
-from landmark_extractor.mediapipe_facemesh import MediaPipeFaceMeshExtractor
+# `python src/main.py` puts src/ on sys.path; the modules import each other
+# through the src package, so the repository root is needed instead
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.actuator.alert import AlertActuator, LogAlertOutput, SoundDeviceAlertOutput
+from src.actuator.evidence import EvidenceRecorder
+from src.decision_engine.events import DecisionEventEmitter
+from src.decision_engine.time_consecutive import TimeConsecutiveDecisionEngine
+from src.diagnostics.memory import AllocationTracker
+from src.diagnostics.tracing import FrameTracer
+from src.feature_extractor.ear import compute_ear
+from src.framesource.webcam import WebcamFrameSource
+from src.landmark_extractor.eye_tracker import EyeLandmarkTracker
+from src.landmark_extractor.mediapipe_facemesh import MediaPipeFaceMeshExtractor
+from src.runtime.cpu_budget import CpuBudget
 
 LEFT_EYE_IDX = [33, 160, 158, 133, 153, 144]
 RIGHT_EYE_IDX = [362, 385, 387, 263, 373, 380]
 
+logger = logging.getLogger(__name__)
+
 
 def main():
-    source = WebcamFrameSource(device_index=0)
+    # DMS_OPENCV_THREADS, DMS_CPU_AFFINITY, DMS_MAX_FPS; applied before any
+    # thread starts so the affinity mask is inherited by all of them
+    cpu_budget = CpuBudget.from_env()
+    logger.info("CPU budget: %s", cpu_budget.apply())
+
+    source = WebcamFrameSource(device_index=0, max_fps=cpu_budget.max_fps)
     landmark_extractor = MediaPipeFaceMeshExtractor()
+    # Opt-in: DMS_EYE_TRACK_FRAMES=3 runs FaceMesh once every 4 frames and
+    # tracks the eye landmarks with optical flow in between
+    eye_track_frames = int(os.environ.get("DMS_EYE_TRACK_FRAMES", "0"))
+    if eye_track_frames > 0:
+        landmark_extractor = EyeLandmarkTracker(
+            landmark_extractor,
+            eye_groups=[LEFT_EYE_IDX, RIGHT_EYE_IDX],
+            max_tracked_frames=eye_track_frames,
+        )
     decision_engine = TimeConsecutiveDecisionEngine(
         ear_threshold=0.35, min_closed_time_sec=1.5  # provisional  # provisional
     )
+    # Downstream consumers only see state changes and periodic heartbeats
+    decision_events = DecisionEventEmitter(
+        hysteresis_sec=0.2, heartbeat_interval_sec=60.0
+    )
+    alert_outputs = [LogAlertOutput()]
+    try:
+        alert_outputs.append(SoundDeviceAlertOutput())
+    except RuntimeError as exc:
+        logger.warning("Audio alerts disabled: %s", exc)
+    actuator = AlertActuator(alert_outputs)
+    # Opt-in: DMS_MEMORY_DIAGNOSTICS=1 python src/main.py
+    allocations = AllocationTracker(
+        enabled=os.environ.get("DMS_MEMORY_DIAGNOSTICS") == "1"
+    )
+    allocations.start()
+    # Opt-in: DMS_TRACE_FILE=trace.json python src/main.py
+    trace_file = os.environ.get("DMS_TRACE_FILE")
+    tracer = FrameTracer(
+        enabled=trace_file is not None,
+        spike_threshold_ms=200.0,
+        spike_path=f"{trace_file}.spike.json" if trace_file else None,
+    )
+    # Opt-in: DMS_EVIDENCE_DIR=evidence python src/main.py
+    evidence_dir = os.environ.get("DMS_EVIDENCE_DIR")
+    evidence = EvidenceRecorder(evidence_dir) if evidence_dir else None
 
     while True:
-        frame = source.read()
+        read_start_us = tracer.now_us()
+        with allocations.stage("read"):
+            frame = source.read()
         if frame is None:
+            # read() has already backed off, so retrying does not spin
+            if source.stalled:
+                timestamp_ms = int(source.clock() * 1000)
+                decision = decision_engine.update_camera_stalled(timestamp_ms)
+                actuator.on_decision(decision, timestamp_ms)
+                for event in decision_events.feed(
+                    decision, timestamp_ms, face_detected=False
+                ):
+                    logger.info("%s %s", event, source.health())
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                break
             continue
 
-        image = frame["image"]
-        result = landmark_extractor.extract(image)
+        frame_id = frame.frame_id
+        tracer.add_span("read", frame_id, read_start_us)
+
+        image = frame.image
+        if evidence is not None:
+            # The recorder keeps the raw frame and it must not be modified
+            # afterwards, so the overlays below are drawn on a copy
+            evidence.push(image, frame.timestamp_ms)
+            image = image.copy()
+        with allocations.stage("extract"), tracer.span("extract", frame_id):
+            result = landmark_extractor.extract(image)
 
         ear_avg = 0.0  # Default value when no face is detected
 
-        if result["face_detected"]:
-            landmarks = result["landmarks"]
+        if result.face_detected:
+            landmarks = result.landmarks
             h, w, _ = image.shape
             left_eye = [landmarks[idx] for idx in LEFT_EYE_IDX]
             right_eye = [landmarks[idx] for idx in RIGHT_EYE_IDX]
 
-            ear_left = compute_ear(left_eye)
-            ear_right = compute_ear(right_eye)
-            ear_avg = (ear_left + ear_right) / 2.0
-            decision = decision_engine.update(
-                ear=ear_avg, timestamp_ms=frame["timestamp_ms"]
-            )
+            with allocations.stage("ear"), tracer.span("ear", frame_id):
+                ear_left = compute_ear(left_eye)
+                ear_right = compute_ear(right_eye)
+                ear_avg = (ear_left + ear_right) / 2.0
+            with allocations.stage("update"), tracer.span("update", frame_id):
+                decision = decision_engine.update(
+                    ear=ear_avg, timestamp_ms=frame.timestamp_ms
+                )
 
             # Draw LEFT eye landmarks (green)
             for idx in LEFT_EYE_IDX:
@@ -52,10 +132,16 @@ def main():
                 x = int(lm["x"] * w)
                 y = int(lm["y"] * h)
                 cv2.circle(image, (x, y), 3, (0, 0, 255), -1)
+        else:
+            # Explicit face-absent signal; the extractor backs off meanwhile
+            with allocations.stage("update"), tracer.span("update", frame_id):
+                decision = decision_engine.update_face_absent(
+                    timestamp_ms=frame.timestamp_ms
+                )
 
         cv2.putText(
             image,
-            f"State: {decision['state']} ({decision['closed_time_sec']:.2f}s)",
+            f"State: {decision.state} ({decision.closed_time_sec:.2f}s)",
             (20, 40),
             cv2.FONT_HERSHEY_SIMPLEX,
             1,
@@ -63,14 +149,48 @@ def main():
             2,
         )
 
-        cv2.imshow("Webcam test with smoothed FPS - press q to quit", image)
-
-        if cv2.waitKey(1) & 0xFF == ord("q"):
+        tracer.end_frame(frame_id, frame.timestamp_ms, frame.capture_monotonic_ns)
+        actuator.on_decision(decision, frame.timestamp_ms)
+        for event in decision_events.feed(
+            decision, frame.timestamp_ms, face_detected=result.face_detected
+        ):
+            logger.info("%s", event)
+            if (
+                evidence is not None
+                and event["type"] == "transition"
+                and event["to"] == "DROWSY"
+            ):
+                evidence.trigger(event["timestamp_ms"], label="drowsy")
+
+        with tracer.span("display", frame_id):
+            cv2.imshow("Webcam test with smoothed FPS - press q to quit", image)
+            key = cv2.waitKey(1) & 0xFF
+        allocations.end_frame()
+        cpu_budget.pace()
+
+        if key == ord("q"):
             break
 
+    if allocations.enabled:
+        logger.info("%s", allocations.report())
+        allocations.stop()
+    if tracer.enabled:
+        tracer.flush()
+        tracer.dump(trace_file)
+    actuator.close()
+    logger.info("Alert latency: %s", actuator.latency_stats())
+    if evidence is not None:
+        evidence.close()
+        logger.info("Evidence clips: %s", evidence.clip_paths)
+    logger.info("Camera health: %s", source.health())
+    logger.info("CPU usage: %s", cpu_budget.report())
+
     landmark_extractor.close()
     cv2.destroyAllWindows()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
     main()
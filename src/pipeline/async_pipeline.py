@@ -0,0 +1,146 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+_END_OF_STREAM = object()
+
+
+class AsyncPipeline:
+    """
+    asyncio driver for the frame -> landmarks -> features -> decision loop.
+
+    Capture and FaceMesh inference run on their own threads, so the pipeline
+    can share an event loop with other I/O. Capture of the next frame
+    overlaps inference on the current one through a small queue. Decisions
+    are exposed as an async stream; cancelling the consumer or leaving the
+    `async with` block shuts everything down, including
+    `landmark_extractor.close()` and the frame source release.
+
+    Usage:
+        frames = AsyncFrameSource(WebcamFrameSource())
+        async with AsyncPipeline(frames, extractor, engine, feature_fn) as pipeline:
+            async for result in pipeline.decisions():
+                ...
+    """
+
+    def __init__(
+        self,
+        frames,
+        landmark_extractor,
+        decision_engine,
+        feature_fn,
+        executor=None,
+        queue_size=1,
+    ):
+        """
+        Args:
+            frames: async iterator of frames, e.g. AsyncFrameSource; its
+                aclose() is awaited on shutdown if present
+            landmark_extractor: object with extract(image_bgr) and close()
+            decision_engine: object with update(ear, timestamp_ms) and
+                update_face_absent(timestamp_ms)
+            feature_fn (callable): maps landmarks to the EAR fed to the engine
+            executor (Executor | None): executor for extract() calls; a
+                private single-thread executor is created if None
+            queue_size (int): frames captured ahead of inference
+        """
+        self.frames = frames
+        self.landmark_extractor = landmark_extractor
+        self.decision_engine = decision_engine
+        self.feature_fn = feature_fn
+        self.queue_size = queue_size
+
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="dms-inference"
+        )
+        self._closed = False
+
+    async def decisions(self):
+        """
+        Async stream of per-frame decisions.
+
+        Yields:
+            dict: {
+                "frame_id": int,
+                "timestamp_ms": int,
+                "face_detected": bool,
+                "ear": float | None,
+                "decision": dict from the decision engine
+            }
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        capture = asyncio.ensure_future(self._capture(queue))
+
+        try:
+            while True:
+                frame = await queue.get()
+                if frame is _END_OF_STREAM:
+                    break
+                if isinstance(frame, BaseException):
+                    raise frame
+
+                result = await loop.run_in_executor(
+                    self.executor, self.landmark_extractor.extract, frame["image"]
+                )
+
+                if result["face_detected"]:
+                    ear = self.feature_fn(result["landmarks"])
+                    decision = self.decision_engine.update(
+                        ear=ear, timestamp_ms=frame["timestamp_ms"]
+                    )
+                else:
+                    ear = None
+                    decision = self.decision_engine.update_face_absent(
+                        timestamp_ms=frame["timestamp_ms"]
+                    )
+
+                yield {
+                    "frame_id": frame["frame_id"],
+                    "timestamp_ms": frame["timestamp_ms"],
+                    "face_detected": result["face_detected"],
+                    "ear": ear,
+                    "decision": decision,
+                }
+        finally:
+            capture.cancel()
+            try:
+                await capture
+            except asyncio.CancelledError:
+                pass
+
+    async def _capture(self, queue):
+        try:
+            async for frame in self.frames:
+                await queue.put(frame)
+        except Exception as exc:
+            await queue.put(exc)
+            return
+        await queue.put(_END_OF_STREAM)
+
+    async def aclose(self):
+        """
+        Releases the frame source and closes the landmark extractor.
+
+        close() is queued on the inference thread, so it only runs after any
+        in-flight extract() has returned.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        loop = asyncio.get_running_loop()
+        try:
+            if hasattr(self.frames, "aclose"):
+                await self.frames.aclose()
+        finally:
+            await loop.run_in_executor(self.executor, self.landmark_extractor.close)
+            if self._owns_executor:
+                self.executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+        return False
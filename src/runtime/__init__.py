@@ -0,0 +1 @@
+# Runtime package
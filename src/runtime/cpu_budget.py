@@ -0,0 +1,176 @@
+import logging
+import os
+import time
+
+import cv2
+
+logger = logging.getLogger(__name__)
+
+
+class CpuBudget:
+    """
+    Bounds the CPU used by the frame loop.
+
+    - `opencv_threads` sets cv2.setNumThreads (0 disables OpenCV's pool).
+    - `cpu_affinity` pins the process to a set of cores. On Linux the mask
+      is per thread and inherited by threads started later, so apply() must
+      run before the camera, FaceMesh graph and worker threads are created.
+      Pinning to N cores caps the process at N cores' worth of CPU.
+    - `max_fps` caps the frame rate; pace() sleeps away the rest of each
+      frame period instead of processing frames nobody needs.
+
+    report() returns the achieved frame rate per percent of one core, to
+    compare settings on the target device.
+
+    Usage:
+        budget = CpuBudget.from_env()
+        budget.apply()
+        while True:
+            ...
+            budget.pace()
+    """
+
+    def __init__(
+        self,
+        opencv_threads=None,
+        cpu_affinity=None,
+        max_fps=None,
+        clock=time.monotonic,
+        cpu_clock=time.process_time,
+    ):
+        """
+        Args:
+            opencv_threads (int | None): OpenCV worker threads; None keeps
+                OpenCV's default
+            cpu_affinity (set[int] | None): cores the process may run on;
+                None keeps the inherited mask
+            max_fps (float | None): frame-rate cap; None disables pacing
+            clock (callable): returns the current time in seconds. If it has
+                a sleep() method, pacing sleeps through it.
+            cpu_clock (callable): returns the CPU time of the process in
+                seconds
+        """
+        if max_fps is not None and max_fps <= 0:
+            raise ValueError("max_fps must be positive")
+
+        self.opencv_threads = opencv_threads
+        self.cpu_affinity = set(cpu_affinity) if cpu_affinity is not None else None
+        self.max_fps = max_fps
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+
+        self.frames = 0
+        self._next_due = None
+        self._start_sec = clock()
+        self._start_cpu_sec = cpu_clock()
+
+    @classmethod
+    def from_env(cls, environ=None, **kwargs):
+        """
+        Reads DMS_OPENCV_THREADS (int), DMS_CPU_AFFINITY (e.g. "0-1,3") and
+        DMS_MAX_FPS (float); unset variables keep the defaults.
+        """
+        environ = os.environ if environ is None else environ
+        opencv_threads = environ.get("DMS_OPENCV_THREADS")
+        cpu_affinity = environ.get("DMS_CPU_AFFINITY")
+        max_fps = environ.get("DMS_MAX_FPS")
+        return cls(
+            opencv_threads=int(opencv_threads) if opencv_threads else None,
+            cpu_affinity=parse_cpu_list(cpu_affinity) if cpu_affinity else None,
+            max_fps=float(max_fps) if max_fps else None,
+            **kwargs,
+        )
+
+    def apply(self):
+        """
+        Applies the thread count and affinity, and restarts measurement.
+
+        Returns:
+            dict: {"opencv_threads": int, "cpu_affinity": set[int] | None}
+            as in effect afterwards
+        """
+        if self.opencv_threads is not None:
+            cv2.setNumThreads(self.opencv_threads)
+
+        if self.cpu_affinity is not None:
+            if hasattr(os, "sched_setaffinity"):
+                os.sched_setaffinity(0, self.cpu_affinity)
+            else:
+                logger.warning("CPU affinity is not supported on this platform")
+
+        self.reset()
+        return {
+            "opencv_threads": cv2.getNumThreads(),
+            "cpu_affinity": (
+                os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+            ),
+        }
+
+    def pace(self):
+        """
+        Counts a frame and, with max_fps set, sleeps until the next frame is
+        due. A frame that overran its period resets the schedule rather than
+        letting the following frames catch up.
+        """
+        self.frames += 1
+        if self.max_fps is None:
+            return
+
+        now_sec = self.clock()
+        if self._next_due is None:
+            self._next_due = now_sec
+        self._next_due += 1.0 / self.max_fps
+
+        delay = self._next_due - now_sec
+        if delay > 0:
+            getattr(self.clock, "sleep", time.sleep)(delay)
+        else:
+            self._next_due = now_sec
+
+    def report(self):
+        """
+        Returns:
+            dict: {
+                "frames": int,
+                "wall_sec": float,
+                "cpu_sec": float,
+                "fps": float,
+                "cpu_percent": float,  # 100 = one full core
+                "fps_per_cpu_percent": float | None
+            } since apply() or the last reset()
+        """
+        wall_sec = self.clock() - self._start_sec
+        cpu_sec = self.cpu_clock() - self._start_cpu_sec
+        fps = self.frames / wall_sec if wall_sec > 0 else 0.0
+        cpu_percent = 100.0 * cpu_sec / wall_sec if wall_sec > 0 else 0.0
+        return {
+            "frames": self.frames,
+            "wall_sec": wall_sec,
+            "cpu_sec": cpu_sec,
+            "fps": fps,
+            "cpu_percent": cpu_percent,
+            "fps_per_cpu_percent": fps / cpu_percent if cpu_percent > 0 else None,
+        }
+
+    def reset(self):
+        self.frames = 0
+        self._next_due = None
+        self._start_sec = self.clock()
+        self._start_cpu_sec = self.cpu_clock()
+
+
+def parse_cpu_list(text):
+    """Parses a Linux CPU list such as "0-2,5" into {0, 1, 2, 5}."""
+    cpus = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-", 1)
+            cpus.update(range(int(first), int(last) + 1))
+        else:
+            cpus.add(int(part))
+    if not cpus:
+        raise ValueError(f"Empty CPU list: {text!r}")
+    return cpus
@@ -0,0 +1 @@
+# Actuator tests
@@ -0,0 +1,155 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.actuator.alert import AlertActuator, LogAlertOutput, SoundDeviceAlertOutput
+
+
+class RecordingOutput:
+    """Output that records alerts and can be made slow."""
+
+    def __init__(self, delay_sec=0.0):
+        self.delay_sec = delay_sec
+        self.levels = []
+        self.fired = threading.Event()
+
+    def fire(self, level, decision):
+        time.sleep(self.delay_sec)
+        self.levels.append(level)
+        self.fired.set()
+
+
+def drowsy(closed_time_sec=2.0):
+    return {"state": "DROWSY", "closed_time_sec": closed_time_sec}
+
+
+AWAKE = {"state": "AWAKE", "closed_time_sec": 0.0}
+
+
+class TestAlertActuator:
+    """Tests for AlertActuator class."""
+
+    def test_fires_on_transition_to_drowsy(self):
+        """Test that an alert fires when the state becomes DROWSY."""
+        output = RecordingOutput()
+        actuator = AlertActuator([output])
+
+        assert actuator.on_decision(AWAKE, 0) is False
+        assert actuator.on_decision(drowsy(), 100) is True
+        actuator.close()
+
+        assert output.levels == [0]
+        assert actuator.alerts_fired == 1
+
+    def test_debounces_and_escalates_while_drowsy(self):
+        """Test that repeated DROWSY decisions alert only every interval, escalating."""
+        output = RecordingOutput()
+        actuator = AlertActuator([output], repeat_interval_sec=1.0, max_level=2)
+
+        queued = [actuator.on_decision(drowsy(), ts) for ts in range(0, 4001, 100)]
+        actuator.close()
+
+        assert sum(queued) == 5
+        assert output.levels == [0, 1, 2, 2, 2]
+
+    def test_escalation_resets_after_recovery(self):
+        """Test that escalation restarts after a long enough AWAKE period."""
+        output = RecordingOutput()
+        actuator = AlertActuator([output], repeat_interval_sec=1.0, reset_after_sec=5.0)
+
+        actuator.on_decision(drowsy(), 0)
+        actuator.on_decision(drowsy(), 1000)
+        actuator.on_decision(AWAKE, 1500)
+        actuator.on_decision(drowsy(), 3000)
+        actuator.on_decision(AWAKE, 3500)
+        actuator.on_decision(drowsy(), 9000)
+        actuator.close()
+
+        assert output.levels == [0, 1, 1, 0]
+
+    def test_slow_output_does_not_block_frame_loop(self):
+        """Test that on_decision returns immediately even if outputs are slow."""
+        output = RecordingOutput(delay_sec=0.2)
+        actuator = AlertActuator([output], repeat_interval_sec=0.0, queue_size=2)
+
+        start = time.perf_counter()
+        for ts in range(10):
+            actuator.on_decision(drowsy(), ts)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.05
+        assert actuator.alerts_dropped > 0
+        actuator.close()
+
+    def test_records_latency(self):
+        """Test that decision-to-alert latency is measured."""
+        output = RecordingOutput()
+        actuator = AlertActuator([output])
+
+        assert actuator.latency_stats()["count"] == 0
+
+        actuator.on_decision(drowsy(), 0)
+        actuator.close()
+
+        stats = actuator.latency_stats()
+        assert stats["count"] == 1
+        assert 0.0 <= stats["p50_ms"] <= stats["max_ms"] < 1000.0
+
+    def test_latency_includes_output_time(self):
+        """Test that a slow output is reflected in the alert latency."""
+        output = RecordingOutput(delay_sec=0.05)
+        actuator = AlertActuator([output])
+
+        actuator.on_decision(drowsy(), 0)
+        actuator.close()
+
+        assert actuator.latency_stats()["max_ms"] >= 50.0
+
+    def test_failing_output_does_not_stop_others(self):
+        """Test that one failing output does not prevent the others."""
+        broken = MagicMock()
+        broken.fire.side_effect = RuntimeError("no speaker")
+        output = RecordingOutput()
+        actuator = AlertActuator([broken, output])
+
+        actuator.on_decision(drowsy(), 0)
+        actuator.close()
+
+        assert output.levels == [0]
+        assert actuator.output_errors == 1
+
+
+class TestOutputs:
+    """Tests for alert outputs."""
+
+    def test_log_output(self):
+        """Test that the log output writes a warning."""
+        log = MagicMock()
+        LogAlertOutput(log).fire(1, drowsy(2.5))
+        log.warning.assert_called_once()
+
+    def test_sounddevice_output_uses_preloaded_buffers(self):
+        """Test that tones are synthesized up front and played by level."""
+        fake_sounddevice = MagicMock()
+        with patch.dict("sys.modules", {"sounddevice": fake_sounddevice}):
+            output = SoundDeviceAlertOutput(
+                frequencies_hz=(440.0, 880.0), duration_sec=0.1, sample_rate=8000
+            )
+
+        assert len(output.buffers) == 2
+        assert output.buffers[0].dtype == np.float32
+        assert output.buffers[0].shape == (800,)
+
+        output.fire(5, drowsy())
+        buffer, sample_rate = fake_sounddevice.play.call_args.args
+        assert buffer is output.buffers[1]
+        assert sample_rate == 8000
+
+    def test_sounddevice_missing(self):
+        """Test a clear error when sounddevice cannot be imported."""
+        with patch.dict("sys.modules", {"sounddevice": None}):
+            with pytest.raises(RuntimeError, match="sounddevice"):
+                SoundDeviceAlertOutput()
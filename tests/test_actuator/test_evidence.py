@@ -0,0 +1,233 @@
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from src.actuator.evidence import EvidenceRecorder
+
+
+def make_image(value, shape=(48, 64, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def read_clip(path):
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while True:
+        ok, image = cap.read()
+        if not ok:
+            break
+        frames.append(image)
+    cap.release()
+    return frames
+
+
+@pytest.fixture(params=[None, 90], ids=["raw", "jpeg"])
+def jpeg_quality(request):
+    return request.param
+
+
+class TestEvidenceRecorder:
+    """Tests for EvidenceRecorder."""
+
+    def test_clip_contains_pre_and_post_event_frames(self, tmp_path, jpeg_quality):
+        """Test that a clip holds the ring contents plus the post-event window."""
+        recorder = EvidenceRecorder(
+            str(tmp_path),
+            pre_event_sec=0.5,
+            post_event_sec=0.3,
+            fps=10.0,
+            jpeg_quality=jpeg_quality,
+            queue_size=64,
+        )
+        for i in range(11):
+            recorder.push(make_image(i * 10), i * 100)
+        recorder.trigger(1000, label="drowsy")
+        for i in range(11, 20):
+            recorder.push(make_image(i * 10), i * 100)
+        recorder.close()
+
+        assert recorder.clips_written == 1
+        assert recorder.clip_paths == [str(tmp_path / "drowsy_1000.mp4")]
+        frames = read_clip(recorder.clip_paths[0])
+        # 600..1000 ms from the 5-slot ring, then 1100..1300 ms
+        assert len(frames) == 8
+        means = [frame.mean() for frame in frames]
+        assert means == pytest.approx([60, 70, 80, 90, 100, 110, 120, 130], abs=5)
+
+    def test_ring_is_bounded(self, tmp_path, jpeg_quality):
+        """Test that the ring never holds more than pre_event_sec of frames."""
+        recorder = EvidenceRecorder(
+            str(tmp_path),
+            pre_event_sec=0.2,
+            fps=10.0,
+            jpeg_quality=jpeg_quality,
+            queue_size=256,
+        )
+        for i in range(200):
+            recorder.push(make_image(i % 256), i * 100)
+        recorder.close()
+
+        assert recorder.capacity == 2
+        assert len(recorder._slots) == 2
+        assert recorder.clips_written == 0
+
+    def test_scale_downsizes_stored_frames(self, tmp_path):
+        """Test that stored frames are downscaled before encoding."""
+        recorder = EvidenceRecorder(
+            str(tmp_path), pre_event_sec=0.3, post_event_sec=0.0, fps=10.0, scale=0.5
+        )
+        for i in range(3):
+            recorder.push(make_image(100), i * 100)
+        recorder.trigger(200)
+        recorder.close()
+
+        frames = read_clip(recorder.clip_paths[0])
+        assert frames[0].shape == (24, 32, 3)
+
+    def test_overlapping_triggers_merge(self, tmp_path):
+        """Test that a trigger during an open clip does not start another."""
+        recorder = EvidenceRecorder(
+            str(tmp_path), pre_event_sec=0.2, post_event_sec=1.0, fps=10.0
+        )
+        recorder.push(make_image(0), 0)
+        recorder.trigger(0)
+        recorder.push(make_image(0), 100)
+        recorder.trigger(100)
+        recorder.push(make_image(0), 2000)
+        recorder.close()
+
+        assert recorder.triggers_merged == 1
+        assert recorder.clips_written == 1
+
+    def test_trigger_after_clip_window_starts_new_clip(self, tmp_path):
+        """Test that a trigger past the open clip's window is not merged."""
+        recorder = EvidenceRecorder(
+            str(tmp_path), pre_event_sec=0.2, post_event_sec=0.5, fps=10.0
+        )
+        stored = threading.Semaphore(0)
+        store = recorder._store
+
+        def counting_store(timestamp_ms, image):
+            entry = store(timestamp_ms, image)
+            stored.release()
+            return entry
+
+        recorder._store = counting_store
+        for timestamp_ms, trigger_ms in [(0, 0), (100, 1000), (1100, None)]:
+            recorder.push(make_image(0), timestamp_ms)
+            assert stored.acquire(timeout=5.0)
+            if trigger_ms is not None:
+                recorder.trigger(trigger_ms)
+        recorder.close()
+
+        assert recorder.triggers_merged == 0
+        assert recorder.clips_written == 2
+
+    def test_push_drops_instead_of_blocking(self, tmp_path):
+        """Test that a full queue drops frames instead of waiting."""
+        recorder = EvidenceRecorder(str(tmp_path), fps=10.0, queue_size=1)
+        release = threading.Event()
+        store = recorder._store
+
+        def slow_store(timestamp_ms, image):
+            release.wait()
+            return store(timestamp_ms, image)
+
+        recorder._store = slow_store
+        pushed = [recorder.push(make_image(0), i) for i in range(50)]
+        release.set()
+        recorder.close()
+
+        assert pushed.count(False) > 0
+        assert recorder.frames_dropped == pushed.count(False)
+
+    def test_trigger_is_kept_when_frame_queue_is_full(self, tmp_path):
+        """Test that a trigger survives a full frame queue and frames still queued."""
+        recorder = EvidenceRecorder(
+            str(tmp_path), pre_event_sec=0.5, post_event_sec=0.2, fps=10.0, queue_size=4
+        )
+        entered = threading.Event()
+        release = threading.Event()
+        store = recorder._store
+
+        def slow_store(timestamp_ms, image):
+            entered.set()
+            release.wait()
+            return store(timestamp_ms, image)
+
+        recorder._store = slow_store
+        pushed = [recorder.push(make_image(0), 0)]
+        assert entered.wait(timeout=5.0)
+        pushed += [recorder.push(make_image(i * 10), i * 100) for i in range(1, 20)]
+        assert not all(pushed)
+
+        # Frame 0 is blocked in the worker, 1-4 are queued, 5-19 were dropped
+        assert pushed.index(False) == 5
+        recorder.trigger(500, label="drowsy")
+        release.set()
+        for i in range(20, 25):
+            recorder.push(make_image(i * 10), i * 100)
+        recorder.close()
+
+        assert recorder.clip_paths == [str(tmp_path / "drowsy_500.mp4")]
+        # The 0.5 s before the trigger (100-400 ms), though still queued when
+        # it arrived, ends up in the clip in order
+        frames = read_clip(recorder.clip_paths[0])
+        means = [frame.mean() for frame in frames]
+        assert means == pytest.approx([10, 20, 30, 40], abs=5)
+
+    def test_store_errors_do_not_stop_the_ring(self, tmp_path):
+        """Test that a frame that cannot be stored is skipped and close() returns."""
+        recorder = EvidenceRecorder(
+            str(tmp_path),
+            pre_event_sec=0.5,
+            post_event_sec=0.3,
+            fps=10.0,
+            queue_size=64,
+        )
+        store = recorder._store
+
+        def flaky_store(timestamp_ms, image):
+            if timestamp_ms % 200:
+                raise cv2.error("resize failed")
+            return store(timestamp_ms, image)
+
+        recorder._store = flaky_store
+        for i in range(10):
+            recorder.push(make_image(i * 10), i * 100)
+        recorder.trigger(900, label="drowsy")
+        for i in range(10, 13):
+            recorder.push(make_image(i * 10), i * 100)
+        recorder.close(timeout_sec=5.0)
+
+        assert not recorder._ring_thread.is_alive()
+        assert recorder.store_errors == 6
+        frames = read_clip(recorder.clip_paths[0])
+        means = [frame.mean() for frame in frames]
+        assert means == pytest.approx([60, 80, 100, 120], abs=5)
+
+    def test_close_returns_when_ring_is_stuck(self, tmp_path):
+        """Test that close() gives up after timeout_sec if the ring never drains."""
+        recorder = EvidenceRecorder(str(tmp_path), fps=10.0, queue_size=1)
+        entered = threading.Event()
+        release = threading.Event()
+        store = recorder._store
+
+        def stuck_store(timestamp_ms, image):
+            entered.set()
+            release.wait()
+            return store(timestamp_ms, image)
+
+        recorder._store = stuck_store
+        recorder.push(make_image(0), 0)
+        assert entered.wait(timeout=5.0)
+        assert recorder.push(make_image(0), 100)
+
+        try:
+            recorder.close(timeout_sec=0.05)
+            assert recorder._ring_thread.is_alive()
+        finally:
+            release.set()
+        recorder.close()
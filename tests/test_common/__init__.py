@@ -0,0 +1 @@
+# Common tests
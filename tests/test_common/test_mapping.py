@@ -0,0 +1,38 @@
+import pytest
+
+from src.common.mapping import SlotMapping
+
+
+class Point(SlotMapping):
+    __slots__ = ("x", "y", "label")
+
+    _KEYS = ("x", "y")
+
+    def __init__(self, x, y, label=None):
+        self.x = x
+        self.y = y
+        self.label = label
+
+
+class TestSlotMapping:
+    """Tests for SlotMapping class."""
+
+    def test_mapping_covers_only_listed_keys(self):
+        """Test that only the keys in _KEYS are part of the Mapping."""
+        point = Point(1, 2, label="eye")
+
+        assert point["x"] == 1
+        assert dict(point) == {"x": 1, "y": 2}
+        assert point == {"x": 1, "y": 2}
+        assert len(point) == 2
+        assert point.get("label") is None
+        with pytest.raises(KeyError):
+            point["label"]
+
+    def test_subclass_stays_slotted(self):
+        """Test that subclasses do not gain a per-instance __dict__."""
+        point = Point(1, 2)
+
+        assert not hasattr(point, "__dict__")
+        with pytest.raises(AttributeError):
+            point.z = 3
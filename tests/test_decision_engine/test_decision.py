@@ -0,0 +1,42 @@
+import pytest
+
+from src.decision_engine.decision import AWAKE_OPEN, Decision
+
+
+class TestDecision:
+    """Tests for the Decision contract."""
+
+    def test_key_access_matches_attributes(self):
+        """Test that mapping keys return the attribute values."""
+        decision = Decision("DROWSY", 2.0, 0.5)
+
+        assert decision["state"] == decision.state == "DROWSY"
+        assert decision["closed_time_sec"] == 2.0
+        assert decision.get("face_absent_sec") == 0.5
+        assert decision.get("missing", 1) == 1
+
+    def test_compares_equal_to_legacy_dict(self):
+        """Test equality with the legacy update() dict in both directions."""
+        legacy = {"state": "AWAKE", "closed_time_sec": 0.0}
+
+        assert AWAKE_OPEN == legacy
+        assert legacy == AWAKE_OPEN
+        assert Decision("DROWSY", 1.6) == {"state": "DROWSY", "closed_time_sec": 1.6}
+        assert AWAKE_OPEN.face_absent_sec is None
+        assert "face_absent_sec" not in AWAKE_OPEN
+
+    def test_face_absent_compares_equal_to_legacy_dict(self):
+        """Test equality with the legacy update_face_absent() dict."""
+        decision = Decision("NO_FACE", 0.0, 1.2)
+
+        assert decision == {
+            "state": "NO_FACE",
+            "closed_time_sec": 0.0,
+            "face_absent_sec": 1.2,
+        }
+        assert len(decision) == 3
+
+    def test_unknown_key_raises_key_error(self):
+        """Test that unknown keys behave like a missing dict key."""
+        with pytest.raises(KeyError):
+            Decision("AWAKE")["ear"]
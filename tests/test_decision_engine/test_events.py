@@ -0,0 +1,114 @@
+from src.decision_engine.events import DecisionEventEmitter
+from src.decision_engine.time_consecutive import TimeConsecutiveDecisionEngine
+
+
+def decision(state, closed_time_sec=0.0):
+    return {"state": state, "closed_time_sec": closed_time_sec}
+
+
+class TestDecisionEventEmitter:
+    """Tests for DecisionEventEmitter class."""
+
+    def test_first_frame_emits_initial_state(self):
+        """Test that the first decision is reported once."""
+        emitter = DecisionEventEmitter(heartbeat_interval_sec=None)
+
+        events = emitter.feed(decision("AWAKE"), 0)
+        assert events == [
+            {
+                "type": "transition",
+                "from": None,
+                "to": "AWAKE",
+                "timestamp_ms": 0,
+                "confirmed_ms": 0,
+            }
+        ]
+        assert emitter.feed(decision("AWAKE"), 33) == []
+
+    def test_only_transitions_are_emitted(self):
+        """Test that steady states produce no events."""
+        emitter = DecisionEventEmitter(heartbeat_interval_sec=None)
+        states = ["AWAKE"] * 50 + ["DROWSY"] * 50 + ["AWAKE"] * 50
+
+        events = []
+        for i, state in enumerate(states):
+            events.extend(emitter.feed(decision(state), i * 33))
+
+        assert [(e["from"], e["to"]) for e in events] == [
+            (None, "AWAKE"),
+            ("AWAKE", "DROWSY"),
+            ("DROWSY", "AWAKE"),
+        ]
+
+    def test_hysteresis_suppresses_flicker(self):
+        """Test that short-lived changes are not reported."""
+        emitter = DecisionEventEmitter(hysteresis_sec=0.5, heartbeat_interval_sec=None)
+        emitter.feed(decision("AWAKE"), 0)
+        emitter.feed(decision("AWAKE"), 500)
+
+        # 200 ms of DROWSY is not enough
+        assert emitter.feed(decision("DROWSY"), 1000) == []
+        assert emitter.feed(decision("DROWSY"), 1200) == []
+        assert emitter.feed(decision("AWAKE"), 1300) == []
+
+        assert emitter.feed(decision("DROWSY"), 2000) == []
+        (event,) = emitter.feed(decision("DROWSY"), 2500)
+        assert event["to"] == "DROWSY"
+        assert event["timestamp_ms"] == 2000
+        assert event["confirmed_ms"] == 2500
+
+    def test_face_lost_and_regained(self):
+        """Test face presence events."""
+        emitter = DecisionEventEmitter(heartbeat_interval_sec=None)
+        emitter.feed(decision("AWAKE"), 0, face_detected=True)
+
+        (lost,) = emitter.feed(decision("AWAKE"), 100, face_detected=False)
+        assert emitter.feed(decision("AWAKE"), 200, face_detected=False) == []
+        (regained,) = emitter.feed(decision("AWAKE"), 300, face_detected=True)
+
+        assert lost["type"] == "face_lost"
+        assert lost["timestamp_ms"] == 100
+        assert regained["type"] == "face_regained"
+
+    def test_heartbeat_aggregates_statistics(self):
+        """Test that heartbeats carry closed-time statistics for their interval."""
+        emitter = DecisionEventEmitter(heartbeat_interval_sec=1.0)
+
+        heartbeats = []
+        for i in range(21):
+            ts = i * 100
+            if 3 <= i <= 7:
+                d = decision("AWAKE", closed_time_sec=(i - 2) * 0.1)
+            else:
+                d = decision("AWAKE")
+            for event in emitter.feed(d, ts, face_detected=i < 15):
+                if event["type"] == "heartbeat":
+                    heartbeats.append(event)
+
+        assert len(heartbeats) == 2
+        first, second = heartbeats
+        assert first["timestamp_ms"] == 1000
+        assert first["frames"] == 11
+        assert abs(first["closed_time_sec"] - 0.5) < 1e-9
+        assert abs(first["max_closed_time_sec"] - 0.5) < 1e-9
+        assert first["face_absent_time_sec"] == 0.0
+
+        assert second["frames"] == 10
+        assert second["closed_time_sec"] == 0.0
+        assert abs(second["face_absent_time_sec"] - 0.6) < 1e-9
+
+    def test_reduces_volume_on_long_drive(self):
+        """Test that an hour at 30 FPS yields a handful of events."""
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5
+        )
+        emitter = DecisionEventEmitter(hysteresis_sec=0.2, heartbeat_interval_sec=60.0)
+
+        count = 0
+        for i in range(30 * 3600):
+            ts = i * 33
+            # One 3 s eye closure every 10 minutes
+            ear = 0.2 if (i % 18000) < 90 else 0.4
+            count += len(emitter.feed(engine.update(ear=ear, timestamp_ms=ts), ts))
+
+        assert count < 30 * 3600 / 500
@@ -0,0 +1,136 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.decision_engine.multi_driver import (
+    STATE_NAMES,
+    MultiDriverDecisionEngine,
+)
+from src.decision_engine.time_consecutive import TimeConsecutiveDecisionEngine
+
+
+def make_engine(num_drivers=4):
+    return MultiDriverDecisionEngine(
+        num_drivers=num_drivers, ear_threshold=0.35, min_closed_time_sec=1.5
+    )
+
+
+class TestMultiDriverDecisionEngine:
+    """Tests for MultiDriverDecisionEngine class."""
+
+    def test_initialization(self):
+        """Test that all drivers start AWAKE with no closed start."""
+        engine = make_engine()
+        assert engine.state.shape == (4,)
+        assert all(engine.get_state(i) == "AWAKE" for i in range(4))
+
+    def test_drivers_are_independent(self):
+        """Test that one driver's closure does not affect another."""
+        engine = make_engine()
+
+        engine.update_batch([0, 1], [0.3, 0.4], [0, 0])
+        result = engine.update_batch([0, 1], [0.3, 0.3], [1500, 1500])
+
+        assert list(STATE_NAMES[result["state"]]) == ["DROWSY", "AWAKE"]
+        assert result["closed_time_sec"].tolist() == [1.5, 0.0]
+
+    def test_repeated_driver_in_batch_is_sequential(self):
+        """Test that several samples of one driver in a batch apply in order."""
+        engine = make_engine()
+
+        result = engine.update_batch(
+            [2, 2, 3, 2, 2], [0.3, 0.3, 0.3, 0.3, 0.4], [0, 1000, 0, 1500, 2000]
+        )
+
+        assert list(STATE_NAMES[result["state"]]) == [
+            "AWAKE",
+            "AWAKE",
+            "AWAKE",
+            "DROWSY",
+            "AWAKE",
+        ]
+        assert result["closed_time_sec"].tolist() == [0.0, 1.0, 0.0, 1.5, 0.0]
+        assert engine.get_state(2) == "AWAKE"
+
+    def test_zero_min_closed_time_open_eyes_stay_awake(self):
+        """Test that open eyes are AWAKE even with a zero time threshold."""
+        engine = MultiDriverDecisionEngine(
+            num_drivers=1, ear_threshold=0.35, min_closed_time_sec=0.0
+        )
+        result = engine.update_batch([0, 0], [0.4, 0.3], [0, 10])
+        assert list(STATE_NAMES[result["state"]]) == ["AWAKE", "DROWSY"]
+
+    def test_matches_single_driver_engine(self):
+        """Test identical results to one TimeConsecutiveDecisionEngine per driver."""
+        rng = np.random.default_rng(0)
+        num_drivers = 20
+        engine = make_engine(num_drivers)
+        reference = [
+            TimeConsecutiveDecisionEngine(ear_threshold=0.35, min_closed_time_sec=1.5)
+            for _ in range(num_drivers)
+        ]
+        clock_ms = np.zeros(num_drivers, dtype=np.int64)
+
+        for _ in range(200):
+            ids = rng.integers(0, num_drivers, 16)
+            ears = np.where(rng.random(16) < 0.7, 0.2, 0.45)
+            timestamps = []
+            for driver_id in ids:
+                clock_ms[driver_id] += rng.integers(20, 400)
+                timestamps.append(int(clock_ms[driver_id]))
+
+            result = engine.update_batch(ids, ears, timestamps)
+
+            for k, driver_id in enumerate(ids):
+                expected = reference[driver_id].update(
+                    ear=float(ears[k]), timestamp_ms=timestamps[k]
+                )
+                assert STATE_NAMES[result["state"][k]] == expected["state"]
+                assert result["closed_time_sec"][k] == expected["closed_time_sec"]
+
+    def test_empty_batch(self):
+        """Test that an empty batch is a no-op."""
+        result = make_engine().update_batch([], [], [])
+        assert result["state"].size == 0
+
+    def test_invalid_driver_id(self):
+        """Test that out-of-range driver ids are rejected."""
+        with pytest.raises(ValueError, match="out of range"):
+            make_engine().update_batch([4], [0.3], [0])
+
+    def test_mismatched_shapes(self):
+        """Test that batch arrays must have matching shapes."""
+        with pytest.raises(ValueError, match="same shape"):
+            make_engine().update_batch([0, 1], [0.3], [0, 0])
+
+    def test_reset(self):
+        """Test that reset forgets closed-eye history."""
+        engine = make_engine()
+        engine.update_batch([0, 1], [0.3, 0.3], [0, 0])
+        engine.update_batch([0, 1], [0.3, 0.3], [2000, 2000])
+
+        engine.reset([0])
+        result = engine.update_batch([0, 1], [0.3, 0.3], [2100, 2100])
+
+        assert list(STATE_NAMES[result["state"]]) == ["AWAKE", "DROWSY"]
+
+    @pytest.mark.slow
+    def test_per_sample_cost_flat_in_driver_count(self):
+        """Test that per-batch cost does not grow with the number of drivers."""
+        batch = 1000
+
+        def time_batches(num_drivers):
+            engine = make_engine(num_drivers)
+            rng = np.random.default_rng(1)
+            ids = rng.choice(num_drivers, batch, replace=False)
+            ears = rng.random(batch)
+            start = time.perf_counter()
+            for step in range(50):
+                engine.update_batch(ids, ears, np.full(batch, step * 33))
+            return time.perf_counter() - start
+
+        small = time_batches(2000)
+        large = time_batches(200000)
+
+        assert large < small * 5
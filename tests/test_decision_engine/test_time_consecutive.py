@@ -252,3 +252,99 @@ class TestTimeConsecutiveDecisionEngine:
 
         result3 = engine_long.update(ear=0.3, timestamp_ms=3000)
         assert result3["state"] == "DROWSY"
+
+    def test_brief_face_loss_keeps_state(self):
+        """Test that a short face loss does not reset the decision."""
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5, face_absent_timeout_sec=1.0
+        )
+
+        engine.update(ear=0.3, timestamp_ms=0)
+        engine.update(ear=0.3, timestamp_ms=1600)
+
+        result = engine.update_face_absent(timestamp_ms=1700)
+        assert result["state"] == "DROWSY"
+        assert abs(result["closed_time_sec"] - 1.6) < 1e-6
+        assert result["face_absent_sec"] == 0.0
+
+        result = engine.update_face_absent(timestamp_ms=2500)
+        assert result["state"] == "DROWSY"
+        assert abs(result["closed_time_sec"] - 1.6) < 1e-6
+        assert abs(result["face_absent_sec"] - 0.8) < 1e-6
+
+    def test_face_absent_time_not_counted_as_closed(self):
+        """Test that frames without a face do not accumulate closed-eye time."""
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5, face_absent_timeout_sec=1.0
+        )
+
+        engine.update(ear=0.3, timestamp_ms=0)
+        for timestamp_ms in range(100, 1000, 100):
+            engine.update_face_absent(timestamp_ms=timestamp_ms)
+        engine.update_face_absent(timestamp_ms=999)
+        result = engine.update(ear=0.3, timestamp_ms=1500)
+
+        # 0-100 ms and 999-1500 ms of closed eyes were seen
+        assert result["state"] == "AWAKE"
+        assert abs(result["closed_time_sec"] - 0.601) < 1e-6
+        assert engine.face_absent_start_ts is None
+
+        result = engine.update(ear=0.3, timestamp_ms=2400)
+        assert result["state"] == "DROWSY"
+
+    def test_face_absent_timeout_reports_no_face(self):
+        """Test that a long face loss resets accumulation and reports NO_FACE."""
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5, face_absent_timeout_sec=1.0
+        )
+
+        engine.update(ear=0.3, timestamp_ms=0)
+        engine.update_face_absent(timestamp_ms=100)
+        result = engine.update_face_absent(timestamp_ms=1100)
+
+        assert result["state"] == "NO_FACE"
+        assert result["closed_time_sec"] == 0.0
+        assert engine.closed_start_ts is None
+
+        result = engine.update(ear=0.3, timestamp_ms=1200)
+        assert result["state"] == "AWAKE"
+        assert result["closed_time_sec"] == 0.0
+        assert engine.face_absent_start_ts is None
+
+    def test_face_absent_before_any_face(self):
+        """Test that the face-absent signal works on the first frame."""
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5
+        )
+
+        result = engine.update_face_absent(timestamp_ms=0)
+        assert result["state"] == "AWAKE"
+        assert result["closed_time_sec"] == 0.0
+
+    def test_open_eyes_reuse_shared_decision(self):
+        """Test that open-eye frames return the shared decision object."""
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5
+        )
+        first = engine.update(ear=0.4, timestamp_ms=0)
+        second = engine.update(ear=0.4, timestamp_ms=33)
+        assert first is second
+        assert second.state == "AWAKE"
+
+    def test_camera_stall_resets_accumulation(self):
+        """Test that a camera stall reports CAMERA_STALLED and forgets closed time."""
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5
+        )
+
+        engine.update(ear=0.3, timestamp_ms=0)
+        engine.update(ear=0.3, timestamp_ms=1600)
+        result = engine.update_camera_stalled(timestamp_ms=3000)
+
+        assert result["state"] == "CAMERA_STALLED"
+        assert result["closed_time_sec"] == 0.0
+        assert engine.closed_start_ts is None
+
+        result = engine.update(ear=0.3, timestamp_ms=3100)
+        assert result["state"] == "AWAKE"
+        assert result["closed_time_sec"] == 0.0
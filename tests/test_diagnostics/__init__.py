@@ -0,0 +1 @@
+# Diagnostics tests
@@ -0,0 +1,136 @@
+import pytest
+
+from src.decision_engine.time_consecutive import TimeConsecutiveDecisionEngine
+from src.diagnostics.memory import AllocationTracker, current_rss_bytes
+from src.feature_extractor.ear import compute_ear
+from src.framesource.synthetic import (
+    LEFT_EYE_IDX,
+    RIGHT_EYE_IDX,
+    SyntheticLandmarkStream,
+)
+
+
+class TestAllocationTracker:
+    """Tests for AllocationTracker class."""
+
+    def test_disabled_tracker_records_nothing(self):
+        """Test that a disabled tracker is a no-op."""
+        tracker = AllocationTracker(enabled=False)
+        tracker.start()
+
+        with tracker.stage("read"):
+            _ = [0] * 1000
+        tracker.end_frame()
+
+        report = tracker.report()
+        assert report["stages"] == {}
+        assert report["rss_bytes"] is None
+        assert tracker.frame_count == 0
+        tracker.stop()
+
+    def test_stage_records_retained_allocations(self):
+        """Test that objects kept by a stage are counted."""
+        tracker = AllocationTracker(sample_every=1)
+        tracker.start()
+        kept = []
+        try:
+            for _ in range(3):
+                with tracker.stage("extract"):
+                    kept.append([{"x": float(i)} for i in range(100)])
+                tracker.end_frame()
+        finally:
+            tracker.stop()
+
+        stage = tracker.report()["stages"]["extract"]
+        assert stage["samples"] == 3
+        assert stage["objects_per_frame"] >= 100
+        assert stage["bytes_per_frame"] > 100 * 50
+
+    def test_only_sampled_frames_are_measured(self):
+        """Test that stages are measured every sample_every frames after warmup."""
+        tracker = AllocationTracker(sample_every=5, warmup_frames=10)
+        tracker.start()
+        try:
+            for _ in range(30):
+                with tracker.stage("update"):
+                    pass
+                tracker.end_frame()
+        finally:
+            tracker.stop()
+
+        assert tracker.report()["stages"]["update"]["samples"] == 4
+        assert len(tracker.history) == 4
+
+    def test_detects_leak(self):
+        """Test that a stage that keeps growing shows positive growth."""
+        tracker = AllocationTracker(sample_every=10)
+        tracker.start()
+        leak = []
+        try:
+            for _ in range(500):
+                with tracker.stage("leaky"):
+                    leak.append(bytearray(1000))
+                tracker.end_frame()
+        finally:
+            tracker.stop()
+
+        assert tracker.growth_per_frame() > 900
+
+    def test_top_allocations_points_at_leak(self):
+        """Test that the snapshot comparison names the leaking line."""
+        tracker = AllocationTracker()
+        tracker.start()
+        leak = []
+        try:
+            for _ in range(100):
+                leak.append(bytearray(10000))
+            top = tracker.top_allocations(limit=1)
+        finally:
+            tracker.stop()
+
+        assert "test_memory.py" in top[0]["location"]
+        assert top[0]["size_diff"] >= 100 * 10000
+
+    def test_growth_needs_two_samples(self):
+        """Test that growth is zero without enough history."""
+        assert AllocationTracker().growth_per_frame() == 0.0
+
+    def test_current_rss_bytes(self):
+        """Test that RSS is reported as a positive number of bytes."""
+        rss = current_rss_bytes()
+        assert rss is None or rss > 0
+
+    @pytest.mark.slow
+    def test_pipeline_is_memory_stable(self):
+        """Steady-state test: feature and decision stages must not leak."""
+        stream = SyntheticLandmarkStream(seed=11)
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5
+        )
+        tracker = AllocationTracker(sample_every=20, warmup_frames=200)
+        tracker.start()
+        try:
+            for frame in stream.frames(2000):
+                with tracker.stage("extract"):
+                    result = {
+                        "face_detected": frame["face_detected"],
+                        "landmarks": frame["landmarks"],
+                    }
+                if result["face_detected"]:
+                    landmarks = result["landmarks"]
+                    with tracker.stage("ear"):
+                        ear_left = compute_ear([landmarks[i] for i in LEFT_EYE_IDX])
+                        ear_right = compute_ear([landmarks[i] for i in RIGHT_EYE_IDX])
+                    with tracker.stage("update"):
+                        engine.update(
+                            ear=(ear_left + ear_right) / 2.0,
+                            timestamp_ms=frame["timestamp_ms"],
+                        )
+                tracker.end_frame()
+        finally:
+            tracker.stop()
+
+        report = tracker.report()
+        assert report["frames"] == 2000
+        # Allow a few bytes/frame of noise, far below one leaked object per frame
+        assert abs(report["traced_growth_per_frame"]) < 16
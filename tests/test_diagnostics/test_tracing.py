@@ -0,0 +1,176 @@
+import json
+import threading
+import time
+from unittest.mock import patch
+
+from src.diagnostics import tracing
+from src.diagnostics.tracing import FrameTracer
+from src.framesource.clock import SimulatedClock
+
+
+class TestFrameTracer:
+    """Tests for FrameTracer class."""
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test that a disabled tracer is a no-op."""
+        tracer = FrameTracer(enabled=False)
+
+        with tracer.span("extract", 0):
+            pass
+        tracer.add_span("read", 0, tracer.now_us())
+
+        assert tracer.end_frame(0, 0) is None
+        assert len(tracer.events) == 0
+
+    def test_span_records_complete_event(self):
+        """Test that a span becomes a Chrome complete ('X') event."""
+        tracer = FrameTracer()
+
+        with tracer.span("extract", 7):
+            pass
+
+        (event,) = tracer.events
+        assert event["name"] == "extract"
+        assert event["ph"] == "X"
+        assert event["dur"] >= 0
+        assert event["args"] == {"frame_id": 7}
+
+    def test_add_span_with_explicit_times(self):
+        """Test recording a span timed by the caller."""
+        tracer = FrameTracer()
+        tracer.add_span("read", 3, start_us=1000.0, end_us=1500.0)
+
+        (event,) = tracer.events
+        assert event["ts"] == 1000.0
+        assert event["dur"] == 500.0
+
+    def test_buffer_is_bounded(self):
+        """Test that old spans are dropped once capacity is reached."""
+        tracer = FrameTracer(capacity=10)
+        for frame_id in range(25):
+            with tracer.span("ear", frame_id):
+                pass
+
+        assert len(tracer.events) == 10
+        assert tracer.events[0]["args"]["frame_id"] == 15
+
+    def test_glass_to_decision_latency(self):
+        """Test that end_frame measures latency from the capture timestamp."""
+        clock = SimulatedClock(start_sec=1000.0)
+        tracer = FrameTracer(clock=clock)
+
+        latency_ms = tracer.end_frame(0, capture_timestamp_ms=1000000 - 50)
+
+        assert 50.0 <= latency_ms < 1000.0
+        assert tracer.events[-1]["name"] == "glass_to_decision"
+
+    def test_latency_follows_wall_clock_changes(self):
+        """Test that the capture time is mapped with the clock read at end_frame."""
+        clock = SimulatedClock(start_sec=1000.0)
+        tracer = FrameTracer(clock=clock)
+        clock.advance(3600.0)
+
+        latency_ms = tracer.end_frame(0, capture_timestamp_ms=4600000 - 50)
+
+        assert latency_ms == 50.0
+
+    def test_monotonic_capture_time_ignores_wall_clock(self):
+        """Test that a monotonic capture time is used instead of the wall clock."""
+        clock = SimulatedClock(start_sec=1000.0)
+        tracer = FrameTracer(clock=clock)
+        capture_ns = time.monotonic_ns() - 50000000
+        # An NTP step back to before the frame was captured
+        clock.now_sec -= 3600.0
+
+        latency_ms = tracer.end_frame(
+            0, capture_timestamp_ms=1000000, capture_monotonic_ns=capture_ns
+        )
+
+        assert 50.0 <= latency_ms < 1000.0
+
+    def test_spike_dumps_trace(self, tmp_path):
+        """Test that a latency spike writes the trace, with a cooldown."""
+        clock = SimulatedClock(start_sec=1000.0)
+        spike_path = tmp_path / "spike.json"
+        tracer = FrameTracer(
+            clock=clock, spike_threshold_ms=100.0, spike_path=str(spike_path)
+        )
+
+        tracer.end_frame(0, capture_timestamp_ms=1000000)
+        assert not spike_path.exists()
+
+        tracer.end_frame(1, capture_timestamp_ms=1000000 - 500)
+        tracer.flush()
+        assert spike_path.exists()
+        spike_path.unlink()
+
+        tracer.end_frame(2, capture_timestamp_ms=1000000 - 500)
+        tracer.flush()
+        assert tracer.spike_count == 2
+        assert not spike_path.exists()
+
+    def test_spike_dump_does_not_block_end_frame(self, tmp_path):
+        """Test that end_frame() returns while the spike dump is still being written."""
+        clock = SimulatedClock(start_sec=1000.0)
+        spike_path = tmp_path / "spike.json"
+        tracer = FrameTracer(
+            clock=clock,
+            spike_threshold_ms=100.0,
+            spike_path=str(spike_path),
+            spike_cooldown_sec=0.0,
+        )
+        for frame_id in range(1000):
+            tracer.add_span("extract", frame_id, 0.0, 10.0)
+
+        writing = threading.Event()
+        release = threading.Event()
+        write_json = tracing._write_json
+
+        def blocked_write_json(path, data):
+            writing.set()
+            release.wait()
+            write_json(path, data)
+
+        with patch.object(tracing, "_write_json", blocked_write_json):
+            tracer.end_frame(0, capture_timestamp_ms=1000000 - 500)
+            assert writing.wait(timeout=5.0)
+            assert not spike_path.exists()
+
+            # The writer is blocked; later spikes queue or drop without waiting
+            tracer.end_frame(1, capture_timestamp_ms=1000000 - 500)
+            tracer.end_frame(2, capture_timestamp_ms=1000000 - 500)
+
+            release.set()
+            tracer.flush()
+
+        assert tracer.spike_dumps_dropped == 1
+        with open(spike_path) as f:
+            assert len(json.load(f)["traceEvents"]) > 1000
+
+    def test_dump_is_valid_chrome_trace(self, tmp_path):
+        """Test that dump writes Chrome trace JSON with thread names."""
+        tracer = FrameTracer()
+
+        def worker():
+            with tracer.span("extract", 1):
+                pass
+
+        thread = threading.Thread(target=worker, name="inference")
+        thread.start()
+        thread.join()
+        with tracer.span("read", 1):
+            pass
+
+        path = tmp_path / "trace.json"
+        tracer.dump(str(path))
+        trace = json.loads(path.read_text())
+
+        names = {
+            event["args"]["name"]
+            for event in trace["traceEvents"]
+            if event["ph"] == "M"
+        }
+        spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        assert "inference" in names
+        assert len({event["tid"] for event in spans}) == 2
+        assert trace["displayTimeUnit"] == "ms"
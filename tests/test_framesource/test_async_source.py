@@ -0,0 +1,70 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+from src.framesource.async_source import AsyncFrameSource
+
+
+def make_source(reads):
+    source = MagicMock()
+    source.read.side_effect = reads
+    return source
+
+
+class TestAsyncFrameSource:
+    """Tests for AsyncFrameSource class."""
+
+    def test_iterates_frames_and_skips_failed_reads(self):
+        """Test that failed reads are retried and frames are yielded in order."""
+        frames = [{"frame_id": 0}, None, None, {"frame_id": 1}]
+        source = make_source(frames)
+
+        async def run():
+            collected = []
+            async with AsyncFrameSource(
+                source, retry_delay_sec=0, max_frames=2
+            ) as frame_source:
+                async for frame in frame_source:
+                    collected.append(frame["frame_id"])
+            return collected
+
+        assert asyncio.run(run()) == [0, 1]
+        assert source.read.call_count == 4
+        source.release.assert_called_once()
+
+    def test_reads_run_off_the_event_loop(self):
+        """Test that read() runs on the capture thread, not the loop thread."""
+        threads = []
+
+        def read():
+            threads.append(threading.current_thread().name)
+            return {"frame_id": 0}
+
+        source = MagicMock()
+        source.read.side_effect = read
+
+        async def run():
+            async with AsyncFrameSource(source, max_frames=1) as frame_source:
+                async for _ in frame_source:
+                    pass
+
+        asyncio.run(run())
+        assert threads[0].startswith("dms-capture")
+
+    def test_aclose_stops_iteration_and_is_idempotent(self):
+        """Test that closing ends iteration and releases only once."""
+        source = make_source(lambda: {"frame_id": 0})
+
+        async def run():
+            frame_source = AsyncFrameSource(source)
+            await frame_source.__anext__()
+            await frame_source.aclose()
+            await frame_source.aclose()
+            try:
+                await frame_source.__anext__()
+            except StopAsyncIteration:
+                return True
+            return False
+
+        assert asyncio.run(run()) is True
+        source.release.assert_called_once()
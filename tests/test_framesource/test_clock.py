@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.framesource.clock import AcceleratedClock, SimulatedClock
+from src.framesource.webcam import WebcamFrameSource
+
+
+class TestAcceleratedClock:
+    """Tests for AcceleratedClock class."""
+
+    def test_runs_faster_than_base_clock(self):
+        """Test that elapsed time is scaled by speedup."""
+        base = MagicMock(side_effect=[10.0, 10.5, 12.0])
+        clock = AcceleratedClock(speedup=100.0, start_sec=1000.0, base_clock=base)
+
+        assert clock() == 1050.0
+        assert clock() == 1200.0
+
+    @patch("src.framesource.clock.time.sleep")
+    def test_sleep_is_scaled(self, mock_sleep):
+        """Test that sleeping simulated time sleeps less wall time."""
+        clock = AcceleratedClock(speedup=100.0, start_sec=0.0)
+        clock.sleep(2.0)
+
+        mock_sleep.assert_called_once_with(0.02)
+
+    def test_invalid_speedup(self):
+        """Test that non-positive speedup is rejected."""
+        with pytest.raises(ValueError):
+            AcceleratedClock(speedup=0)
+
+
+class TestSimulatedClock:
+    """Tests for SimulatedClock class."""
+
+    def test_advance_and_sleep(self):
+        """Test that time only moves when advanced."""
+        clock = SimulatedClock(start_sec=5.0)
+        assert clock() == 5.0
+
+        clock.advance(1.5)
+        clock.sleep(0.5)
+        clock.sleep(-1.0)
+        assert clock() == 7.0
+
+    def test_cannot_go_backwards(self):
+        """Test that advancing by a negative amount fails."""
+        with pytest.raises(ValueError):
+            SimulatedClock().advance(-1.0)
+
+    @patch("src.framesource.webcam.cv2.VideoCapture")
+    def test_webcam_uses_injected_clock(self, mock_video_capture):
+        """Test that WebcamFrameSource stamps frames with the injected clock."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.read.return_value = (True, MagicMock())
+        mock_video_capture.return_value = mock_cap
+
+        clock = SimulatedClock(start_sec=100.0)
+        source = WebcamFrameSource(device_index=0, clock=clock)
+
+        assert source.read()["timestamp_ms"] == 100000
+        clock.advance(0.033)
+        assert source.read()["timestamp_ms"] == 100033
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from src.framesource.frame import Frame
+
+
+class TestFrame:
+    """Tests for the Frame contract."""
+
+    def test_attribute_and_key_access_agree(self):
+        """Test that attributes and mapping keys return the same values."""
+        image = np.zeros((2, 2, 3), dtype=np.uint8)
+        frame = Frame(3, 1000, image, capture_monotonic_ns=42)
+
+        assert frame.frame_id == frame["frame_id"] == 3
+        assert frame.timestamp_ms == frame["timestamp_ms"] == 1000
+        assert frame["image"] is image
+        assert frame.capture_monotonic_ns == 42
+        assert frame.get("stream_timestamp_ms") is None
+
+    def test_unknown_key_raises_key_error(self):
+        """Test that unknown keys behave like a missing dict key."""
+        frame = Frame(0, 0, None)
+
+        with pytest.raises(KeyError):
+            frame["missing"]
+        assert frame.get("missing", "default") == "default"
+        assert "missing" not in frame
+        assert "image" in frame
+
+    def test_compares_equal_to_legacy_dict(self):
+        """Test equality with the legacy webcam dict in both directions."""
+        frame = Frame(1, 2, "image", capture_monotonic_ns=3)
+        legacy = {"frame_id": 1, "timestamp_ms": 2, "image": "image"}
+
+        assert frame == legacy
+        assert legacy == frame
+        assert dict(frame) == legacy
+        assert len(frame) == 3
+        assert "capture_monotonic_ns" not in frame
+
+    def test_network_frame_includes_stream_timestamp(self):
+        """Test that network frames expose the legacy stream_timestamp_ms key."""
+        frame = Frame(1, 2, "image", capture_monotonic_ns=3, stream_timestamp_ms=4.0)
+
+        assert frame == {
+            "frame_id": 1,
+            "timestamp_ms": 2,
+            "image": "image",
+            "stream_timestamp_ms": 4.0,
+        }
+
+    def test_has_no_instance_dict(self):
+        """Test that frames are slotted and reject new attributes."""
+        frame = Frame(0, 0, None)
+
+        assert not hasattr(frame, "__dict__")
+        with pytest.raises(AttributeError):
+            frame.extra = 1
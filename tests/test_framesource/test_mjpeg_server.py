@@ -0,0 +1,38 @@
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pytest
+
+from src.framesource.mjpeg_server import BOUNDARY, MJPEGServer
+
+
+class TestMJPEGServer:
+    """Tests for MJPEGServer class."""
+
+    def test_serves_multipart_jpeg_stream(self):
+        """Test that the stream is multipart JPEG."""
+        images = [np.zeros((16, 16, 3), dtype=np.uint8)]
+        with MJPEGServer(images, port=0, fps=100.0) as server:
+            with urllib.request.urlopen(server.url, timeout=2) as response:
+                content_type = response.headers["Content-Type"]
+                chunk = response.read(512)
+
+        assert content_type == f"multipart/x-mixed-replace; boundary={BOUNDARY}"
+        assert chunk.startswith(f"--{BOUNDARY}\r\n".encode())
+        assert b"\xff\xd8" in chunk
+
+    def test_unknown_path_is_404(self):
+        """Test that only /stream.mjpg is served."""
+        images = [np.zeros((16, 16, 3), dtype=np.uint8)]
+        with MJPEGServer(images, port=0) as server:
+            url = server.url.replace("stream.mjpg", "other")
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                urllib.request.urlopen(url, timeout=2)
+
+        assert excinfo.value.code == 404
+
+    def test_empty_clip_is_rejected(self):
+        """Test that a clip without frames is rejected."""
+        with pytest.raises(ValueError, match="no frames"):
+            MJPEGServer([], port=0)
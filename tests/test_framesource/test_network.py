@@ -0,0 +1,215 @@
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from src.framesource.clock import SimulatedClock
+from src.framesource.mjpeg_server import MJPEGServer
+from src.framesource.network import NetworkStreamFrameSource
+
+
+class FakeCapture:
+    """Capture that yields `num_frames` images, then fails."""
+
+    def __init__(self, num_frames, opened=True, gate=None):
+        self.num_frames = num_frames
+        self.opened = opened
+        self.gate = gate
+        self.index = 0
+        self.released = False
+
+    def isOpened(self):
+        return self.opened
+
+    def set(self, prop, value):
+        return True
+
+    def get(self, prop):
+        return self.index * 40.0
+
+    def read(self):
+        if self.gate is not None:
+            self.gate.wait()
+        if self.index >= self.num_frames:
+            return False, None
+        self.index += 1
+        return True, np.full((2, 2, 3), self.index, dtype=np.uint8)
+
+    def release(self):
+        self.released = True
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestNetworkStreamFrameSource:
+    """Tests for NetworkStreamFrameSource class."""
+
+    def test_drop_to_latest_returns_newest_frame(self):
+        """Test that unread frames are dropped in favour of the newest."""
+        capture = FakeCapture(num_frames=5)
+        factory = MagicMock(side_effect=[capture] + [FakeCapture(0, opened=False)] * 50)
+        source = NetworkStreamFrameSource(
+            "http://camera", capture_factory=factory, ffmpeg_options=None
+        )
+        try:
+            assert wait_until(lambda: source.frames_received == 5)
+            frame = source.read()
+        finally:
+            source.release()
+
+        assert frame["frame_id"] == 0
+        assert frame["image"][0, 0, 0] == 5
+        assert frame["stream_timestamp_ms"] == 200.0
+        assert source.frames_dropped == 4
+
+    def test_buffered_mode_keeps_order(self):
+        """Test that buffered mode delivers frames in order up to buffer_size."""
+        factory = MagicMock(
+            side_effect=[FakeCapture(3)] + [FakeCapture(0, opened=False)] * 50
+        )
+        source = NetworkStreamFrameSource(
+            "http://camera",
+            drop_to_latest=False,
+            buffer_size=8,
+            capture_factory=factory,
+            ffmpeg_options=None,
+        )
+        try:
+            assert wait_until(lambda: source.frames_received == 3)
+            values = [source.read()["image"][0, 0, 0] for _ in range(3)]
+        finally:
+            source.release()
+
+        assert values == [1, 2, 3]
+        assert source.frames_dropped == 0
+
+    def test_read_times_out_without_frames(self):
+        """Test that read returns None when no frame arrives in time."""
+        gate = threading.Event()
+        factory = MagicMock(return_value=FakeCapture(1, gate=gate))
+        source = NetworkStreamFrameSource(
+            "http://camera",
+            read_timeout_sec=0.05,
+            capture_factory=factory,
+            ffmpeg_options=None,
+        )
+        try:
+            assert source.read() is None
+        finally:
+            gate.set()
+            source.release()
+
+    def test_timestamps_use_arrival_clock(self):
+        """Test that timestamp_ms is the arrival time on the injected clock."""
+        factory = MagicMock(
+            side_effect=[FakeCapture(1)] + [FakeCapture(0, opened=False)] * 50
+        )
+        source = NetworkStreamFrameSource(
+            "http://camera",
+            clock=SimulatedClock(start_sec=42.0),
+            capture_factory=factory,
+            ffmpeg_options=None,
+        )
+        try:
+            frame = source.read()
+        finally:
+            source.release()
+
+        assert frame["timestamp_ms"] == 42000
+
+    def test_reconnects_with_backoff(self):
+        """Test that failed opens back off and a dropped stream reconnects."""
+        captures = [
+            FakeCapture(2),
+            FakeCapture(0, opened=False),
+            FakeCapture(0, opened=False),
+            FakeCapture(2),
+        ] + [FakeCapture(0, opened=False)] * 50
+        factory = MagicMock(side_effect=captures)
+        source = NetworkStreamFrameSource(
+            "http://camera",
+            reconnect_initial_delay_sec=0.01,
+            reconnect_max_delay_sec=0.02,
+            capture_factory=factory,
+            ffmpeg_options=None,
+        )
+        try:
+            assert wait_until(lambda: source.frames_received == 4)
+        finally:
+            source.release()
+
+        assert source.reconnects >= 2
+        assert captures[0].released and captures[3].released
+
+    def test_recovers_from_capture_errors(self):
+        """Test that errors while opening or reading are logged and retried."""
+        failing = FakeCapture(1)
+        failing.read = MagicMock(side_effect=cv2.error("decoder crashed"))
+        working = FakeCapture(2)
+        factory = MagicMock(
+            side_effect=[OSError("connection refused"), failing, working]
+            + [FakeCapture(0, opened=False)] * 50
+        )
+        source = NetworkStreamFrameSource(
+            "http://camera",
+            reconnect_initial_delay_sec=0.01,
+            reconnect_max_delay_sec=0.02,
+            capture_factory=factory,
+            ffmpeg_options=None,
+        )
+        try:
+            assert wait_until(lambda: source.frames_received == 2)
+        finally:
+            source.release()
+
+        assert failing.released and working.released
+
+    def test_ffmpeg_options_are_set_once(self, monkeypatch):
+        """Test that the FFmpeg options are set at construction, not per reconnect."""
+        monkeypatch.delenv("OPENCV_FFMPEG_CAPTURE_OPTIONS", raising=False)
+        options = []
+
+        def factory(url):
+            options.append(os.environ.pop("OPENCV_FFMPEG_CAPTURE_OPTIONS", None))
+            return FakeCapture(0)
+
+        source = NetworkStreamFrameSource(
+            "http://camera",
+            reconnect_initial_delay_sec=0.01,
+            capture_factory=factory,
+            ffmpeg_options="fflags;nobuffer",
+        )
+        try:
+            assert wait_until(lambda: len(options) >= 3)
+        finally:
+            source.release()
+
+        assert options[0] == "fflags;nobuffer"
+        assert options[1:3] == [None, None]
+
+    @pytest.mark.integration
+    def test_streams_from_local_mjpeg_server(self):
+        """Test end to end against the local MJPEG stand-in server."""
+        images = [np.full((48, 64, 3), 40 * i, dtype=np.uint8) for i in range(5)]
+        with MJPEGServer(images, port=0, fps=50.0) as server:
+            source = NetworkStreamFrameSource(server.url, stream_timeout_sec=2.0)
+            try:
+                frames = [source.read() for _ in range(10)]
+            finally:
+                source.release()
+
+        frames = [frame for frame in frames if frame is not None]
+        assert len(frames) >= 5
+        assert frames[0]["image"].shape == (48, 64, 3)
+        assert [frame["frame_id"] for frame in frames] == list(range(len(frames)))
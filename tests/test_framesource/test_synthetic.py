@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+
+from src.decision_engine.time_consecutive import TimeConsecutiveDecisionEngine
+from src.feature_extractor.ear import compute_ear
+from src.framesource.clock import AcceleratedClock, SimulatedClock
+from src.framesource.synthetic import (
+    LEFT_EYE_IDX,
+    NUM_LANDMARKS,
+    RIGHT_EYE_IDX,
+    SyntheticLandmarkStream,
+    run_decision_load,
+)
+
+
+class TestSyntheticLandmarkStream:
+    """Tests for SyntheticLandmarkStream class."""
+
+    def test_generate_shapes(self):
+        """Test that generated arrays have one entry per frame."""
+        data = SyntheticLandmarkStream(seed=1).generate(1000)
+
+        assert data["timestamp_ms"].shape == (1000,)
+        assert data["ear"].shape == (1000,)
+        assert data["face_detected"].shape == (1000,)
+        assert data["head_offset"].shape == (1000, 2)
+
+    def test_same_seed_is_reproducible(self):
+        """Test that a seed fully determines the stream."""
+        a = SyntheticLandmarkStream(seed=7).generate(5000)
+        b = SyntheticLandmarkStream(seed=7).generate(5000)
+
+        np.testing.assert_array_equal(a["timestamp_ms"], b["timestamp_ms"])
+        np.testing.assert_array_equal(a["ear"], b["ear"])
+        assert a["events"] == b["events"]
+
+    def test_timestamps_jittered_and_increasing(self):
+        """Test that timestamps are jittered but strictly increasing."""
+        data = SyntheticLandmarkStream(
+            fps=30.0, seed=3, timestamp_jitter_ms=10.0
+        ).generate(10000)
+        diffs = np.diff(data["timestamp_ms"])
+
+        assert (diffs > 0).all()
+        assert diffs.std() > 1.0
+
+    def test_dropouts_have_no_ear(self):
+        """Test that frames without a face carry NaN EAR."""
+        data = SyntheticLandmarkStream(seed=2, dropout_rate_hz=0.5).generate(10000)
+
+        assert not data["face_detected"].all()
+        assert np.isnan(data["ear"][~data["face_detected"]]).all()
+        assert not np.isnan(data["ear"][data["face_detected"]]).any()
+
+    def test_blinks_and_microsleeps_close_eyes(self):
+        """Test that closure events lower EAR below a typical threshold."""
+        stream = SyntheticLandmarkStream(seed=4, dropout_rate_hz=0.0)
+        data = stream.generate(30 * 600)
+        kinds = {event["kind"] for event in data["events"]}
+
+        assert {"blink", "microsleep"} <= kinds
+        assert (data["ear"] < 0.35).any()
+        assert np.median(data["ear"]) > 0.35
+
+    def test_build_landmarks_matches_requested_ear(self):
+        """Test that compute_ear recovers the EAR used to build landmarks."""
+        stream = SyntheticLandmarkStream(seed=0)
+        landmarks = stream.build_landmarks(0.27, dx=0.05, dy=-0.02)
+
+        assert len(landmarks) == NUM_LANDMARKS
+        for eye_idx in (LEFT_EYE_IDX, RIGHT_EYE_IDX):
+            eye = [landmarks[idx] for idx in eye_idx]
+            assert compute_ear(eye) == pytest.approx(0.27)
+
+    def test_frames_with_simulated_clock(self):
+        """Test that frames are paced and stamped by an injected clock."""
+        clock = SimulatedClock(start_sec=50.0)
+        stream = SyntheticLandmarkStream(fps=10.0, seed=5, timestamp_jitter_ms=0.0)
+
+        frames = list(stream.frames(20, clock=clock))
+
+        assert [frame["frame_id"] for frame in frames] == list(range(20))
+        assert frames[0]["timestamp_ms"] == 50000
+        assert frames[-1]["timestamp_ms"] == 51900
+        for frame in frames:
+            assert frame["face_detected"] == (frame["landmarks"] is not None)
+
+    def test_frames_with_accelerated_clock(self):
+        """Test that an accelerated clock runs a paced stream faster than real time."""
+        clock = AcceleratedClock(speedup=1000.0)
+        stream = SyntheticLandmarkStream(fps=30.0, seed=6)
+
+        frames = list(stream.frames(60, clock=clock))
+        span_ms = frames[-1]["timestamp_ms"] - frames[0]["timestamp_ms"]
+
+        assert span_ms >= 1900
+
+    def test_invalid_fps(self):
+        """Test that non-positive fps is rejected."""
+        with pytest.raises(ValueError):
+            SyntheticLandmarkStream(fps=0)
+
+
+class TestRunDecisionLoad:
+    """Tests for run_decision_load function."""
+
+    def test_microsleeps_are_detected(self):
+        """Test that a stream with microsleeps produces DROWSY frames."""
+        stream = SyntheticLandmarkStream(
+            seed=8, microsleep_rate_hz=0.05, dropout_rate_hz=0.0
+        )
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5
+        )
+
+        stats = run_decision_load(engine, stream, 30 * 600)
+
+        assert stats["updates"] == stats["frames"]
+        assert stats["drowsy_frames"] > 0
+
+    def test_no_drowsiness_without_microsleeps(self):
+        """Test that blinks alone never reach DROWSY."""
+        stream = SyntheticLandmarkStream(seed=9, microsleep_rate_hz=0.0)
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5
+        )
+
+        stats = run_decision_load(engine, stream, 30 * 600)
+
+        assert stats["drowsy_frames"] == 0
+        assert stats["updates"] < stats["frames"]
+
+    @pytest.mark.slow
+    def test_soak_one_million_frames(self):
+        """Soak test: about 9 hours of driving well above real time."""
+        stream = SyntheticLandmarkStream(seed=10)
+        engine = TimeConsecutiveDecisionEngine(
+            ear_threshold=0.35, min_closed_time_sec=1.5
+        )
+
+        stats = run_decision_load(engine, stream, 1_000_000)
+
+        assert stats["frames"] == 1_000_000
+        assert stats["speedup"] > 100.0
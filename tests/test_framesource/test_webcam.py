@@ -1,7 +1,9 @@
 from unittest.mock import MagicMock, patch
 
+import cv2
 import pytest
 
+from src.framesource.clock import SimulatedClock
 from src.framesource.webcam import WebcamFrameSource
 
 
@@ -51,6 +53,7 @@ class TestWebcamFrameSource:
         assert result["frame_id"] == 0
         assert result["timestamp_ms"] == 1234567
         assert result["image"] == mock_frame
+        assert result.capture_monotonic_ns is not None
         assert source.frame_id == 1
 
     @patch("src.framesource.webcam.cv2.VideoCapture")
@@ -115,3 +118,168 @@ class TestWebcamFrameSource:
         WebcamFrameSource(device_index=1)
 
         mock_video_capture.assert_called_once_with(1)
+
+    @patch("src.framesource.webcam.cv2.VideoCapture")
+    def test_failed_reads_back_off_exponentially(self, mock_video_capture):
+        """Test that failed reads wait with a growing, capped delay."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.read.return_value = (False, None)
+        mock_video_capture.return_value = mock_cap
+        clock = SimulatedClock()
+
+        source = WebcamFrameSource(
+            clock=clock,
+            monotonic_clock=clock,
+            retry_initial_delay_sec=0.01,
+            retry_max_delay_sec=0.04,
+            stall_timeout_sec=10.0,
+        )
+        times = []
+        for _ in range(4):
+            source.read()
+            times.append(clock())
+
+        assert times == pytest.approx([0.01, 0.03, 0.07, 0.11])
+        assert source.consecutive_failures == 4
+
+    @patch("src.framesource.webcam.cv2.VideoCapture")
+    def test_stall_reopens_device_and_recovers(self, mock_video_capture):
+        """Test that a stall is reported, the device reopened, and reset on recovery."""
+        stalled_cap = MagicMock()
+        stalled_cap.isOpened.return_value = True
+        stalled_cap.read.return_value = (False, None)
+        healthy_cap = MagicMock()
+        healthy_cap.isOpened.return_value = True
+        healthy_cap.read.return_value = (True, MagicMock())
+        mock_video_capture.side_effect = [stalled_cap, healthy_cap]
+        clock = SimulatedClock()
+
+        source = WebcamFrameSource(
+            device_index=2,
+            clock=clock,
+            monotonic_clock=clock,
+            retry_initial_delay_sec=0.1,
+            retry_max_delay_sec=0.5,
+            stall_timeout_sec=1.0,
+        )
+        while source.read() is None and clock() < 1.0:
+            pass
+        assert not source.stalled
+        assert source.reopens == 0
+
+        assert source.read() is None
+        health = source.health()
+        assert health["stalled"] is True
+        assert health["stall_count"] == 1
+        assert health["reopens"] == 1
+        assert health["time_without_frames_sec"] >= 1.0
+        stalled_cap.release.assert_called_once()
+        mock_video_capture.assert_called_with(2)
+
+        frame = source.read()
+        assert frame is not None
+        assert frame.frame_id == 0
+        health = source.health()
+        assert health["stalled"] is False
+        assert health["consecutive_failures"] == 0
+        assert health["stall_count"] == 1
+
+    @patch("src.framesource.webcam.cv2.VideoCapture")
+    def test_failed_reopen_is_retried(self, mock_video_capture):
+        """Test that a device that fails to reopen is retried every stall timeout."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.side_effect = [True, False, False]
+        mock_cap.read.return_value = (False, None)
+        mock_video_capture.return_value = mock_cap
+        clock = SimulatedClock()
+
+        source = WebcamFrameSource(
+            clock=clock,
+            monotonic_clock=clock,
+            retry_max_delay_sec=0.5,
+            stall_timeout_sec=1.0,
+        )
+        while clock() < 3.0:
+            source.read()
+
+        assert source.reopens == 2
+        assert source.stall_count == 1
+
+    @patch("src.framesource.webcam.cv2.VideoCapture")
+    def test_wall_clock_step_does_not_stall(self, mock_video_capture):
+        """Test that stalls are measured on the monotonic clock, not the wall clock."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.read.return_value = (False, None)
+        mock_video_capture.return_value = mock_cap
+        clock = SimulatedClock(start_sec=1000.0)
+        monotonic_clock = SimulatedClock()
+
+        source = WebcamFrameSource(
+            clock=clock,
+            monotonic_clock=monotonic_clock,
+            retry_initial_delay_sec=0.1,
+            stall_timeout_sec=1.0,
+        )
+        # An NTP step of an hour while the camera is briefly silent
+        clock.advance(3600.0)
+        assert source.read() is None
+
+        health = source.health()
+        assert health["stalled"] is False
+        assert health["reopens"] == 0
+        assert health["time_without_frames_sec"] == pytest.approx(0.1)
+        assert clock() == 4600.0
+
+    @patch("src.framesource.webcam.cv2.VideoCapture")
+    def test_max_fps_configures_camera(self, mock_video_capture):
+        """Test that a frame-rate cap lowers the capture rate and buffer."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_video_capture.return_value = mock_cap
+
+        WebcamFrameSource(max_fps=10.0)
+
+        mock_cap.set.assert_any_call(cv2.CAP_PROP_FPS, 10.0)
+        mock_cap.set.assert_any_call(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    @patch("src.framesource.webcam.cv2.VideoCapture")
+    def test_max_fps_skips_queued_frames(self, mock_video_capture):
+        """Test that read() grabs past queued frames before decoding one."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        latest = MagicMock()
+        mock_cap.retrieve.return_value = (True, latest)
+        mock_video_capture.return_value = mock_cap
+        clock = SimulatedClock()
+        # Two grabs return queued frames instantly, the third waits 20 ms
+        grab_sec = iter([0.0001, 0.0001, 0.02])
+
+        def grab():
+            clock.advance(next(grab_sec))
+            return True
+
+        mock_cap.grab.side_effect = grab
+
+        source = WebcamFrameSource(max_fps=10.0, timer=clock)
+        frame = source.read()
+
+        assert frame.image is latest
+        assert mock_cap.grab.call_count == 3
+        mock_cap.retrieve.assert_called_once()
+        mock_cap.read.assert_not_called()
+
+    @patch("src.framesource.webcam.cv2.VideoCapture")
+    def test_max_fps_bounds_skipped_frames(self, mock_video_capture):
+        """Test that at most max_stale_grabs queued frames are skipped."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.grab.return_value = True
+        mock_cap.retrieve.return_value = (True, MagicMock())
+        mock_video_capture.return_value = mock_cap
+
+        source = WebcamFrameSource(max_fps=10.0, max_stale_grabs=2)
+        assert source.read() is not None
+
+        assert mock_cap.grab.call_count == 3
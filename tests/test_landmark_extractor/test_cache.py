@@ -0,0 +1,167 @@
+import os
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.landmark_extractor.cache import (
+    CachedLandmarkExtractor,
+    LandmarkCache,
+    frame_key,
+    image_key,
+)
+
+CONFIG = {"extractor": "Fake", "min_detection_confidence": 0.5}
+
+
+def make_extractor(config=CONFIG, face_detected=True):
+    extractor = MagicMock()
+    extractor.config = dict(config)
+    if face_detected:
+        landmarks = [
+            {"x": 0.5, "y": 0.25, "z": -0.125},
+            {"x": 0.75, "y": 0.5, "z": 0.0},
+        ]
+    else:
+        landmarks = None
+    extractor.extract.return_value = {
+        "face_detected": face_detected,
+        "landmarks": landmarks,
+    }
+    return extractor
+
+
+class TestLandmarkCache:
+    """Tests for LandmarkCache class."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test that cached arrays round-trip as float32."""
+        cache = LandmarkCache(str(tmp_path), CONFIG)
+        cache.put("abcd", [[0.1, 0.2, 0.3]])
+
+        landmarks = cache.get("abcd")
+        assert landmarks.dtype == np.float32
+        np.testing.assert_allclose(landmarks, [[0.1, 0.2, 0.3]], rtol=1e-6)
+        assert cache.get("missing") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_empty_or_truncated_entry_is_a_miss(self, tmp_path):
+        """Test that a zero-byte or truncated .npy file is treated as a miss."""
+        cache = LandmarkCache(str(tmp_path), CONFIG)
+        cache.put("abcd", np.zeros((468, 3)))
+        cache.put("abce", np.zeros((468, 3)))
+        with open(cache._path("abcd"), "wb"):
+            pass
+        with open(cache._path("abce"), "r+b") as f:
+            f.truncate(100)
+
+        assert cache.get("abcd") is None
+        assert cache.get("abce") is None
+        assert cache.misses == 2
+
+    def test_failed_put_leaves_no_partial_entry(self, tmp_path):
+        """Test that a write that fails does not leave an entry or temp file."""
+        cache = LandmarkCache(str(tmp_path), CONFIG)
+
+        with pytest.raises(ValueError):
+            cache.put("abcd", [["not", "a", "number"]])
+
+        assert cache.get("abcd") is None
+        assert os.listdir(os.path.dirname(cache._path("abcd"))) == []
+
+    def test_config_change_invalidates(self, tmp_path):
+        """Test that a different extractor configuration misses the cache."""
+        LandmarkCache(str(tmp_path), CONFIG).put("abcd", [[0.1, 0.2, 0.3]])
+
+        changed = dict(CONFIG, min_detection_confidence=0.7)
+        assert LandmarkCache(str(tmp_path), changed).get("abcd") is None
+        assert LandmarkCache(str(tmp_path), dict(CONFIG)).get("abcd") is not None
+
+    def test_size_bound_evicts_least_recently_used(self, tmp_path):
+        """Test that the cache stays under max_bytes, evicting old entries."""
+        landmarks = np.zeros((468, 3))
+        probe = LandmarkCache(str(tmp_path / "probe"), CONFIG)
+        probe.put("00", landmarks)
+        entry_bytes = probe.total_bytes
+
+        cache = LandmarkCache(
+            str(tmp_path / "cache"), CONFIG, max_bytes=entry_bytes * 5
+        )
+        for i in range(5):
+            key = f"{i:02d}"
+            cache.put(key, landmarks)
+            os.utime(cache._path(key), (i, i))
+
+        # Touch the oldest entry so it becomes most recently used
+        cache.get("00")
+        cache.put("05", landmarks)
+
+        assert cache.total_bytes <= cache.max_bytes
+        assert cache.get("00") is not None
+        assert cache.get("01") is None
+
+    def test_total_bytes_survives_restart(self, tmp_path):
+        """Test that existing entries are counted when the cache is reopened."""
+        cache = LandmarkCache(str(tmp_path), CONFIG)
+        cache.put("abcd", np.zeros((10, 3)))
+
+        assert LandmarkCache(str(tmp_path), CONFIG).total_bytes == cache.total_bytes
+
+
+class TestCachedLandmarkExtractor:
+    """Tests for CachedLandmarkExtractor class."""
+
+    def test_second_run_hits_cache(self, tmp_path):
+        """Test that repeated frames skip inference."""
+        extractor = make_extractor()
+        cached = CachedLandmarkExtractor(extractor, str(tmp_path))
+        image = np.zeros((4, 4, 3), dtype=np.uint8)
+
+        first = cached.extract(image, video_id="drive.mp4", frame_index=3)
+        second = cached.extract(image, video_id="drive.mp4", frame_index=3)
+
+        assert extractor.extract.call_count == 1
+        assert second == first
+
+    def test_no_face_is_cached(self, tmp_path):
+        """Test that frames without a face are cached too."""
+        extractor = make_extractor(face_detected=False)
+        cached = CachedLandmarkExtractor(extractor, str(tmp_path))
+        image = np.zeros((4, 4, 3), dtype=np.uint8)
+
+        cached.extract(image)
+        result = cached.extract(image)
+
+        assert extractor.extract.call_count == 1
+        assert result == {"face_detected": False, "landmarks": None}
+
+    def test_content_key_distinguishes_images(self, tmp_path):
+        """Test that different images without a frame index are not confused."""
+        extractor = make_extractor()
+        cached = CachedLandmarkExtractor(extractor, str(tmp_path))
+
+        cached.extract(np.zeros((4, 4, 3), dtype=np.uint8))
+        cached.extract(np.ones((4, 4, 3), dtype=np.uint8))
+
+        assert extractor.extract.call_count == 2
+
+    def test_close_closes_wrapped_extractor(self, tmp_path):
+        """Test that close is delegated."""
+        extractor = make_extractor()
+        CachedLandmarkExtractor(extractor, str(tmp_path)).close()
+        extractor.close.assert_called_once()
+
+
+class TestKeys:
+    """Tests for cache key helpers."""
+
+    def test_frame_key_depends_on_video_and_index(self):
+        """Test that frame keys are unique per video and index."""
+        assert frame_key("a.mp4", 1) == frame_key("a.mp4", 1)
+        assert frame_key("a.mp4", 1) != frame_key("a.mp4", 2)
+        assert frame_key("a.mp4", 1) != frame_key("b.mp4", 1)
+
+    def test_image_key_depends_on_shape(self):
+        """Test that same bytes with a different shape give different keys."""
+        image = np.zeros((4, 6, 3), dtype=np.uint8)
+        assert image_key(image) != image_key(image.reshape(6, 4, 3))
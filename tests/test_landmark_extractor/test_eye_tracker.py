@@ -0,0 +1,129 @@
+import cv2
+import numpy as np
+import pytest
+
+from src.landmark_extractor.eye_tracker import EyeLandmarkTracker
+from src.landmark_extractor.result import NO_FACE, LandmarkResult
+
+LEFT_EYE_IDX = [33, 160, 158, 133, 153, 144]
+RIGHT_EYE_IDX = [362, 385, 387, 263, 373, 380]
+EYE_OFFSETS = [(-15, 0), (-7, -5), (7, -5), (15, 0), (7, 5), (-7, 5)]
+WIDTH, HEIGHT = 320, 240
+
+
+def textured_image(seed=0):
+    rng = np.random.default_rng(seed)
+    noise = rng.integers(0, 256, size=(HEIGHT, WIDTH), dtype=np.uint8)
+    gray = cv2.GaussianBlur(noise, (0, 0), 2.0)
+    gray = cv2.normalize(gray, None, 0, 255, cv2.NORM_MINMAX)
+    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+
+
+def shift(image, dx, dy):
+    matrix = np.float32([[1, 0, dx], [0, 1, dy]])
+    return cv2.warpAffine(image, matrix, (WIDTH, HEIGHT), borderMode=cv2.BORDER_REFLECT)
+
+
+class FakeExtractor:
+    """Returns landmarks with the eyes at fixed pixel positions."""
+
+    def __init__(self, face_detected=True):
+        self.face_detected = face_detected
+        self.calls = 0
+        self.closed = False
+
+    def extract(self, image_bgr):
+        self.calls += 1
+        if not self.face_detected:
+            return NO_FACE
+        landmarks = [{"x": 0.5, "y": 0.5, "z": 0.0} for _ in range(468)]
+        for indices, (cx, cy) in [
+            (LEFT_EYE_IDX, (120, 100)),
+            (RIGHT_EYE_IDX, (200, 100)),
+        ]:
+            for idx, (ox, oy) in zip(indices, EYE_OFFSETS):
+                landmarks[idx] = {
+                    "x": (cx + ox) / WIDTH,
+                    "y": (cy + oy) / HEIGHT,
+                    "z": 0.1,
+                }
+        return LandmarkResult(True, landmarks)
+
+    def close(self):
+        self.closed = True
+
+
+def eye_pixels(result, indices):
+    landmarks = result["landmarks"]
+    return np.array(
+        [[landmarks[i]["x"] * WIDTH, landmarks[i]["y"] * HEIGHT] for i in indices]
+    )
+
+
+class TestEyeLandmarkTracker:
+    """Tests for EyeLandmarkTracker."""
+
+    def make_tracker(self, extractor, **kwargs):
+        return EyeLandmarkTracker(
+            extractor, eye_groups=[LEFT_EYE_IDX, RIGHT_EYE_IDX], **kwargs
+        )
+
+    def test_tracks_eye_motion_between_full_runs(self):
+        """Test that eye landmarks follow image motion without a full run."""
+        extractor = FakeExtractor()
+        tracker = self.make_tracker(extractor, max_tracked_frames=3)
+        image = textured_image()
+
+        first = tracker.extract(image)
+        tracked = tracker.extract(shift(image, 2.0, -1.0))
+
+        assert extractor.calls == 1
+        assert tracker.tracked_frames == 1
+        assert tracker.tracking_error_px <= tracker.max_error_px
+        for indices in (LEFT_EYE_IDX, RIGHT_EYE_IDX):
+            motion = eye_pixels(tracked, indices) - eye_pixels(first, indices)
+            np.testing.assert_allclose(motion, [[2.0, -1.0]] * 6, atol=0.3)
+        # Landmarks outside the eyes keep the last full result
+        assert tracked["landmarks"][1] is first["landmarks"][1]
+        assert tracked["landmarks"][33]["z"] == pytest.approx(0.1)
+
+    def test_full_run_after_max_tracked_frames(self):
+        """Test that a full extraction runs every max_tracked_frames + 1 frames."""
+        extractor = FakeExtractor()
+        tracker = self.make_tracker(extractor, max_tracked_frames=2)
+        image = textured_image()
+
+        for i in range(6):
+            tracker.extract(shift(image, 0.5 * i, 0.0))
+
+        assert extractor.calls == 2
+        assert tracker.tracked_frames == 4
+
+    def test_redetects_when_tracking_error_is_high(self):
+        """Test that an unrelated frame triggers a full extraction."""
+        extractor = FakeExtractor()
+        tracker = self.make_tracker(extractor, max_tracked_frames=10)
+
+        tracker.extract(textured_image(seed=0))
+        tracker.extract(textured_image(seed=1))
+
+        assert extractor.calls == 2
+        assert tracker.tracking_failures == 1
+
+    def test_no_face_is_never_tracked(self):
+        """Test that frames without a face always run the full extractor."""
+        extractor = FakeExtractor(face_detected=False)
+        tracker = self.make_tracker(extractor)
+        image = textured_image()
+
+        results = [tracker.extract(image) for _ in range(3)]
+
+        assert all(result is NO_FACE for result in results)
+        assert extractor.calls == 3
+
+    def test_close_closes_extractor(self):
+        """Test that close() is forwarded to the full extractor."""
+        extractor = FakeExtractor()
+        self.make_tracker(extractor).close()
+
+        assert extractor.closed
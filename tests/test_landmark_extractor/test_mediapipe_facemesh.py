@@ -168,3 +168,102 @@ class TestMediaPipeFaceMeshExtractor:
         assert result["face_detected"] is True
         assert len(result["landmarks"]) == 1
         assert result["landmarks"][0] == {"x": 0.5, "y": 0.5, "z": 0.0}
+
+    @patch("src.landmark_extractor.mediapipe_facemesh.cv2.resize")
+    @patch("src.landmark_extractor.mediapipe_facemesh.cv2.cvtColor")
+    @patch("src.landmark_extractor.mediapipe_facemesh.mp.solutions.face_mesh")
+    def test_backoff_probes_at_reduced_rate_and_resolution(
+        self, mock_face_mesh_module, mock_cvt_color, mock_resize
+    ):
+        """Test that repeated misses reduce FaceMesh calls and frame size."""
+        mock_face_mesh = MagicMock()
+        mock_face_mesh_module.FaceMesh = MagicMock(return_value=mock_face_mesh)
+
+        mock_process_result = MagicMock()
+        mock_process_result.multi_face_landmarks = None
+        mock_face_mesh.process.return_value = mock_process_result
+
+        image = np.zeros((480, 640, 3), dtype=np.uint8)
+        small = np.zeros((240, 320, 3), dtype=np.uint8)
+        mock_resize.return_value = small
+
+        extractor = MediaPipeFaceMeshExtractor(
+            backoff_after_misses=3, probe_every=4, probe_scale=0.5
+        )
+
+        for _ in range(3):
+            assert extractor.extract(image)["face_detected"] is False
+        assert extractor.backoff is True
+        assert mock_face_mesh.process.call_count == 3
+
+        for _ in range(8):
+            assert extractor.extract(image)["face_detected"] is False
+
+        # Only every 4th frame is probed while backing off, downscaled
+        assert mock_face_mesh.process.call_count == 5
+        assert mock_resize.call_count == 2
+        assert mock_resize.call_args.kwargs["fx"] == 0.5
+        mock_cvt_color.assert_called_with(small, cv2.COLOR_BGR2RGB)
+
+    @patch("src.landmark_extractor.mediapipe_facemesh.cv2.resize")
+    @patch("src.landmark_extractor.mediapipe_facemesh.cv2.cvtColor")
+    @patch("src.landmark_extractor.mediapipe_facemesh.mp.solutions.face_mesh")
+    def test_backoff_ends_when_face_reappears(
+        self, mock_face_mesh_module, mock_cvt_color, mock_resize
+    ):
+        """Test that a successful probe returns to full-rate tracking."""
+        mock_face_mesh = MagicMock()
+        mock_face_mesh_module.FaceMesh = MagicMock(return_value=mock_face_mesh)
+
+        no_face = MagicMock()
+        no_face.multi_face_landmarks = None
+
+        mock_landmark = MagicMock()
+        mock_landmark.x, mock_landmark.y, mock_landmark.z = 0.5, 0.5, 0.0
+        face = MagicMock()
+        face.multi_face_landmarks = [MagicMock(landmark=[mock_landmark])]
+
+        mock_face_mesh.process.side_effect = [no_face, no_face, face, face]
+        image = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        extractor = MediaPipeFaceMeshExtractor(backoff_after_misses=2, probe_every=2)
+
+        extractor.extract(image)
+        extractor.extract(image)
+        assert extractor.backoff is True
+
+        assert extractor.extract(image)["face_detected"] is False
+        result = extractor.extract(image)
+        assert result["face_detected"] is True
+        assert extractor.backoff is False
+        assert extractor.consecutive_misses == 0
+
+        # Next frame is processed at full rate and full resolution
+        assert extractor.extract(image)["face_detected"] is True
+        assert mock_face_mesh.process.call_count == 4
+        assert mock_resize.call_count == 1
+
+    @patch("src.landmark_extractor.mediapipe_facemesh.cv2.cvtColor")
+    @patch("src.landmark_extractor.mediapipe_facemesh.mp.solutions.face_mesh")
+    def test_backoff_disabled(self, mock_face_mesh_module, mock_cvt_color):
+        """Test that backoff_after_misses=None processes every frame."""
+        mock_face_mesh = MagicMock()
+        mock_face_mesh_module.FaceMesh = MagicMock(return_value=mock_face_mesh)
+        mock_face_mesh.process.return_value = MagicMock(multi_face_landmarks=None)
+
+        extractor = MediaPipeFaceMeshExtractor(backoff_after_misses=None)
+        for _ in range(50):
+            extractor.extract(np.zeros((4, 4, 3), dtype=np.uint8))
+
+        assert extractor.backoff is False
+        assert mock_face_mesh.process.call_count == 50
+
+    @patch("src.landmark_extractor.mediapipe_facemesh.mp.solutions.face_mesh")
+    def test_config_reflects_parameters(self, mock_face_mesh_module):
+        """Test that config captures the parameters used for cache keys."""
+        default = MediaPipeFaceMeshExtractor().config
+        custom = MediaPipeFaceMeshExtractor(min_detection_confidence=0.7).config
+
+        assert default["min_detection_confidence"] == 0.5
+        assert custom["min_detection_confidence"] == 0.7
+        assert default["extractor"] == "MediaPipeFaceMeshExtractor"
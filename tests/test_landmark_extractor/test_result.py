@@ -0,0 +1,27 @@
+import pytest
+
+from src.landmark_extractor.result import NO_FACE, LandmarkResult
+
+
+class TestLandmarkResult:
+    """Tests for the LandmarkResult contract."""
+
+    def test_compares_equal_to_legacy_dict(self):
+        """Test equality with the legacy dict contract in both directions."""
+        landmarks = [{"x": 0.1, "y": 0.2, "z": 0.0}]
+        result = LandmarkResult(True, landmarks)
+
+        assert result == {"face_detected": True, "landmarks": landmarks}
+        assert {"face_detected": True, "landmarks": landmarks} == result
+        assert result["landmarks"] is landmarks
+
+    def test_no_face_is_shared_and_empty(self):
+        """Test the shared no-face result."""
+        assert NO_FACE.face_detected is False
+        assert NO_FACE["landmarks"] is None
+        assert NO_FACE == LandmarkResult(False)
+
+    def test_unknown_key_raises_key_error(self):
+        """Test that unknown keys behave like a missing dict key."""
+        with pytest.raises(KeyError):
+            NO_FACE["ear"]
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.decision_engine.time_consecutive import TimeConsecutiveDecisionEngine
+from src.framesource.async_source import AsyncFrameSource
+from src.pipeline.async_pipeline import AsyncPipeline
+
+
+class FakeSource:
+    """Blocking frame source producing frames 100 ms apart."""
+
+    def __init__(self, num_frames=None, read_delay_sec=0.0):
+        self.num_frames = num_frames
+        self.read_delay_sec = read_delay_sec
+        self.frame_id = 0
+        self.released = False
+        self.lock = threading.Lock()
+
+    def read(self):
+        with self.lock:
+            time.sleep(self.read_delay_sec)
+            frame = {
+                "frame_id": self.frame_id,
+                "timestamp_ms": self.frame_id * 100,
+                "image": self.frame_id,
+            }
+            self.frame_id += 1
+            return frame
+
+    def release(self):
+        with self.lock:
+            self.released = True
+
+
+def make_extractor(face_frames):
+    extractor = MagicMock()
+    extractor.extract.side_effect = lambda image: {
+        "face_detected": image in face_frames,
+        "landmarks": ["closed"] if image in face_frames else None,
+    }
+    return extractor
+
+
+def make_engine():
+    return TimeConsecutiveDecisionEngine(ear_threshold=0.35, min_closed_time_sec=0.2)
+
+
+class TestAsyncPipeline:
+    """Tests for AsyncPipeline class."""
+
+    def test_streams_decisions(self):
+        """Test that decisions are produced in frame order."""
+        source = FakeSource()
+        extractor = make_extractor(face_frames={0, 1, 2, 4})
+
+        async def run():
+            frames = AsyncFrameSource(source, max_frames=5)
+            async with AsyncPipeline(
+                frames, extractor, make_engine(), feature_fn=lambda lm: 0.1
+            ) as pipeline:
+                return [result async for result in pipeline.decisions()]
+
+        results = asyncio.run(run())
+
+        assert [r["frame_id"] for r in results] == [0, 1, 2, 3, 4]
+        assert [r["decision"]["state"] for r in results] == [
+            "AWAKE",
+            "AWAKE",
+            "DROWSY",
+            "DROWSY",
+            "DROWSY",
+        ]
+        assert results[3]["face_detected"] is False
+        assert results[3]["ear"] is None
+        assert source.released
+        extractor.close.assert_called_once()
+
+    def test_cancellation_shuts_down_cleanly(self):
+        """Test that cancelling the consumer releases the source and extractor."""
+        source = FakeSource(read_delay_sec=0.01)
+        extractor = make_extractor(face_frames=set())
+        received = []
+
+        async def consume(pipeline):
+            async for result in pipeline.decisions():
+                received.append(result)
+
+        async def run():
+            frames = AsyncFrameSource(source)
+            async with AsyncPipeline(
+                frames, extractor, make_engine(), feature_fn=lambda lm: 0.4
+            ) as pipeline:
+                task = asyncio.ensure_future(consume(pipeline))
+                await asyncio.sleep(0.1)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(run())
+
+        assert received
+        assert source.released
+        extractor.close.assert_called_once()
+
+    def test_extract_runs_off_the_event_loop(self):
+        """Test that FaceMesh inference does not run on the loop thread."""
+        threads = []
+        extractor = MagicMock()
+
+        def extract(image):
+            threads.append(threading.current_thread().name)
+            return {"face_detected": False, "landmarks": None}
+
+        extractor.extract.side_effect = extract
+
+        async def run():
+            frames = AsyncFrameSource(FakeSource(), max_frames=2)
+            async with AsyncPipeline(
+                frames, extractor, make_engine(), feature_fn=lambda lm: 0.4
+            ) as pipeline:
+                async for _ in pipeline.decisions():
+                    await asyncio.sleep(0)
+
+        asyncio.run(run())
+        assert all(name.startswith("dms-inference") for name in threads)
+
+    def test_capture_errors_propagate(self):
+        """Test that an exception raised by the frame source reaches the consumer."""
+
+        class BrokenFrames:
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                raise RuntimeError("camera unplugged")
+
+        extractor = make_extractor(face_frames=set())
+
+        async def run():
+            async with AsyncPipeline(
+                BrokenFrames(), extractor, make_engine(), feature_fn=lambda lm: 0.4
+            ) as pipeline:
+                async for _ in pipeline.decisions():
+                    pass
+
+        with pytest.raises(RuntimeError, match="camera unplugged"):
+            asyncio.run(run())
+        extractor.close.assert_called_once()
@@ -0,0 +1,129 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.framesource.clock import SimulatedClock
+from src.runtime.cpu_budget import CpuBudget, parse_cpu_list
+
+
+class FakeCpuClock:
+    def __init__(self):
+        self.now_sec = 0.0
+
+    def __call__(self):
+        return self.now_sec
+
+
+class TestCpuBudget:
+    """Tests for CpuBudget."""
+
+    @patch("src.runtime.cpu_budget.cv2.setNumThreads")
+    def test_apply_sets_opencv_threads(self, mock_set_num_threads):
+        """Test that apply() configures OpenCV's thread pool."""
+        CpuBudget(opencv_threads=2).apply()
+
+        mock_set_num_threads.assert_called_once_with(2)
+
+    @pytest.mark.skipif(
+        not hasattr(os, "sched_setaffinity"), reason="requires CPU affinity"
+    )
+    def test_apply_sets_affinity(self):
+        """Test that apply() pins the process to the configured cores."""
+        original = os.sched_getaffinity(0)
+        try:
+            applied = CpuBudget(cpu_affinity={min(original)}).apply()
+            assert applied["cpu_affinity"] == {min(original)}
+            assert os.sched_getaffinity(0) == {min(original)}
+        finally:
+            os.sched_setaffinity(0, original)
+
+    def test_defaults_change_nothing(self):
+        """Test that an empty budget leaves threads and affinity alone."""
+        with patch("src.runtime.cpu_budget.cv2.setNumThreads") as mock_threads, patch(
+            "src.runtime.cpu_budget.os.sched_setaffinity", create=True
+        ) as mock_affinity:
+            CpuBudget().apply()
+
+        mock_threads.assert_not_called()
+        mock_affinity.assert_not_called()
+
+    def test_from_env(self):
+        """Test reading the budget from environment variables."""
+        budget = CpuBudget.from_env(
+            {
+                "DMS_OPENCV_THREADS": "1",
+                "DMS_CPU_AFFINITY": "0-1,3",
+                "DMS_MAX_FPS": "15",
+            }
+        )
+
+        assert budget.opencv_threads == 1
+        assert budget.cpu_affinity == {0, 1, 3}
+        assert budget.max_fps == 15.0
+
+        budget = CpuBudget.from_env({})
+        assert budget.opencv_threads is None
+        assert budget.cpu_affinity is None
+        assert budget.max_fps is None
+
+    def test_rejects_non_positive_max_fps(self):
+        """Test that a zero frame-rate cap is rejected."""
+        with pytest.raises(ValueError):
+            CpuBudget(max_fps=0)
+
+    def test_pace_caps_frame_rate(self):
+        """Test that pacing sleeps away the rest of each frame period."""
+        clock = SimulatedClock()
+        budget = CpuBudget(max_fps=10.0, clock=clock, cpu_clock=FakeCpuClock())
+
+        for _ in range(10):
+            clock.advance(0.02)  # 20 ms of work per frame
+            budget.pace()
+
+        assert clock() == pytest.approx(1.02)
+        assert budget.report()["fps"] == pytest.approx(10 / 1.02)
+
+    def test_pace_does_not_catch_up_after_overrun(self):
+        """Test that a slow frame does not make the next frames run back to back."""
+        clock = SimulatedClock()
+        budget = CpuBudget(max_fps=10.0, clock=clock, cpu_clock=FakeCpuClock())
+
+        budget.pace()
+        clock.advance(0.5)
+        budget.pace()
+        start_sec = clock()
+        clock.advance(0.01)
+        budget.pace()
+
+        assert clock() - start_sec == pytest.approx(0.1)
+
+    def test_report_fps_per_cpu_percent(self):
+        """Test the frame-rate-per-CPU-percent metric."""
+        clock = SimulatedClock()
+        cpu_clock = FakeCpuClock()
+        budget = CpuBudget(clock=clock, cpu_clock=cpu_clock)
+
+        for _ in range(30):
+            budget.pace()
+        clock.advance(1.0)
+        cpu_clock.now_sec = 0.5
+
+        report = budget.report()
+        assert report["fps"] == pytest.approx(30.0)
+        assert report["cpu_percent"] == pytest.approx(50.0)
+        assert report["fps_per_cpu_percent"] == pytest.approx(0.6)
+
+
+class TestCpuListHelpers:
+    """Tests for CPU list parsing."""
+
+    def test_parse_cpu_list(self):
+        """Test parsing ranges and single cores."""
+        assert parse_cpu_list("0-2,5") == {0, 1, 2, 5}
+        assert parse_cpu_list(" 3 ") == {3}
+
+    def test_parse_empty_cpu_list(self):
+        """Test that an empty list is rejected."""
+        with pytest.raises(ValueError):
+            parse_cpu_list(",")